@@ -53,11 +53,17 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+@st.cache_resource
+def get_bq_client() -> BigQueryClient:
+    """인증 파일 파싱과 gRPC 클라이언트 생성을 세션/호출 간에 한 번만 수행한다."""
+    return BigQueryClient()
+
+
 @st.cache_data(ttl=60)  # 1분 캐시 (디버깅용으로 짧게)
-def load_messages(mode: str, date_str: str = None, keyword: str = None, limit_chats: int = 10, cache_key: str = None):
+def load_messages(mode: str, date_str: str = None, keyword: str = None, limit_chats: int = 10):
     """메시지 로드 (캐싱)"""
     try:
-        client = BigQueryClient()
+        client = get_bq_client()
         
         if mode == "november":
             df = client.get_messages_by_month(2025, 11, limit_chats)
@@ -70,10 +76,12 @@ def load_messages(mode: str, date_str: str = None, keyword: str = None, limit_ch
         else:
             return pd.DataFrame()
         
-        # 디버깅: 시스템 메시지 확인
-        system_msgs = df[df['plainText'].str.contains('시스템 메시지', na=False)]
-        if len(system_msgs) > 0:
-            st.sidebar.info(f"시스템 메시지 {len(system_msgs)}개 발견")
+        # 디버깅: 시스템 메시지 확인 (옵트인 — 전체 컬럼 스캔이므로 기본은 끔)
+        if st.session_state.get("debug_mode"):
+            # 시스템 메시지는 "[시스템 메시지]"로 시작하므로 startswith가 contains보다 훨씬 싸다
+            system_count = int(df['plainText'].str.startswith('[시스템 메시지]', na=False).sum())
+            if system_count:
+                st.sidebar.info(f"시스템 메시지 {system_count}개 발견")
         
         return df
     except Exception as e:
@@ -83,33 +91,44 @@ def load_messages(mode: str, date_str: str = None, keyword: str = None, limit_ch
         return pd.DataFrame()
 
 
+# personType → (CSS 클래스, 표시 라벨). 메시지마다 dict를 새로 만들지 않도록 모듈 레벨에 둔다
+PERSON_TYPE_STYLES = {
+    'user': ('user', '👤 사용자'),
+    'manager': ('manager', '💼 상담원'),
+    'bot': ('bot', '🤖 봇')
+}
+
+
+# HTML 이스케이프와 <br> 변환을 한 번의 translate 패스로 처리한다
+# (unsafe_allow_html 출력에 사용자 텍스트가 그대로 들어가는 것도 막는다)
+_TEXT_HTML_TRANS = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '\n': '<br>'})
+
+_MESSAGE_TPL = """
+    <div class="chat-message {class_name}">
+        <div class="chat-header">{label}</div>
+        <div class="chat-time">{time_str}</div>
+        <div>{text_html}</div>
+        {workflow_html}
+    </div>
+    """
+
+
 def format_message_html(person_type: str, created_at: datetime, plain_text: str, workflow_info: str = None) -> str:
     """메시지를 HTML로 포맷팅"""
-    type_class = {
-        'user': ('user', '👤 사용자'),
-        'manager': ('manager', '💼 상담원'),
-        'bot': ('bot', '🤖 봇')
-    }.get(person_type, ('user', f'❓ {person_type}'))
-    
-    class_name, label = type_class
-    time_str = created_at.strftime('%Y-%m-%d %H:%M:%S')
-    
-    # 텍스트를 줄바꿈 처리
-    text_html = plain_text.replace('\n', '<br>')
+    class_name, label = PERSON_TYPE_STYLES.get(person_type, ('user', f'❓ {person_type}'))
     
     # 워크플로우 정보 추가
     workflow_html = ""
     if workflow_info and pd.notna(workflow_info):
         workflow_html = f'<div style="font-size: 0.85rem; color: #666; margin-top: 0.5rem; font-style: italic;">{workflow_info}</div>'
     
-    return f"""
-    <div class="chat-message {class_name}">
-        <div class="chat-header">{label}</div>
-        <div class="chat-time">{time_str}</div>
-        <div>{text_html}</div>
-        {workflow_html}
-    </div>
-    """
+    return _MESSAGE_TPL.format(
+        class_name=class_name,
+        label=label,
+        time_str=created_at.strftime('%Y-%m-%d %H:%M:%S'),
+        text_html=plain_text.translate(_TEXT_HTML_TRANS),
+        workflow_html=workflow_html,
+    )
 
 
 def main():
@@ -148,6 +167,8 @@ def main():
         if st.button("🔄 데이터 새로고침", use_container_width=True):
             st.cache_data.clear()
             st.rerun()
+        
+        st.checkbox("시스템 메시지 수 표시 (디버그)", value=False, key="debug_mode")
     
     # 메인 영역
     if mode == "키워드 검색" and not keyword:
@@ -164,42 +185,50 @@ def main():
     
     # 데이터 로드
     with st.spinner("데이터를 불러오는 중..."):
-        # 캐시 키에 현재 시간 추가하여 강제 새로고침 가능하게
-        cache_key = f"{query_mode}_{date_str}_{keyword}_{limit_chats}"
-        df = load_messages(query_mode, date_str, keyword, limit_chats, cache_key)
+        # 쿼리 인자들이 곧 캐시 키; 강제 새로고침은 사이드바 버튼의 cache_data.clear()로 처리
+        df = load_messages(query_mode, date_str, keyword, limit_chats)
     
     if df.empty:
         st.warning("데이터가 없습니다.")
         return
     
-    # 통계 정보
+    # 통계 정보: personType 컬럼을 불리언 마스크로 두 번 스캔하는 대신 한 번의 value_counts로 집계
+    person_counts = df['personType'].value_counts()
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("총 메시지", len(df))
     with col2:
         st.metric("총 대화방", df['chatId'].nunique())
     with col3:
-        st.metric("사용자 메시지", len(df[df['personType'] == 'user']))
+        st.metric("사용자 메시지", int(person_counts.get('user', 0)))
     with col4:
-        st.metric("상담원 메시지", len(df[df['personType'] == 'manager']))
+        st.metric("상담원 메시지", int(person_counts.get('manager', 0)))
     
     st.divider()
     
-    # 대화방별로 그룹화
-    grouped = df.groupby('chatId')
-    chat_ids = list(grouped.groups.keys())
+    # 대화방별 메시지 수를 한 번의 집계로 구한다 (selectbox 옵션마다 get_group 호출 방지)
+    # chatId는 categorical이므로 관측된 값만 집계한다 (pandas 2.x FutureWarning 방지)
+    sizes = df.groupby('chatId', sort=False, observed=True).size()
+    render_chat_panel(df, sizes)
+
+
+@st.fragment
+def render_chat_panel(df: pd.DataFrame, sizes: pd.Series) -> None:
+    """대화방 선택과 메시지 렌더링. 선택 변경 시 이 영역만 다시 실행된다."""
+    chat_ids = sizes.index.tolist()
+    chat_labels = [f"대화방 {idx + 1} ({count}개 메시지)" for idx, count in enumerate(sizes.to_numpy())]
     
     # 대화방 선택
     if len(chat_ids) > 0:
         selected_chat_idx = st.selectbox(
             f"대화방 선택 (총 {len(chat_ids)}개)",
             range(len(chat_ids)),
-            format_func=lambda x: f"대화방 {x+1} ({len(grouped.get_group(chat_ids[x]))}개 메시지)"
+            format_func=chat_labels.__getitem__
         )
         
         selected_chat_id = chat_ids[selected_chat_idx]
-        chat_df = grouped.get_group(selected_chat_id).sort_values('created_at')
-        
+        # df는 _run_query에서 이미 (chatId, created_at) 순으로 정렬돼 있다
+        chat_df = df[df['chatId'].to_numpy() == selected_chat_id]
         # 대화방 정보
         with st.expander("📋 대화방 정보", expanded=False):
             col1, col2 = st.columns(2)
@@ -207,7 +236,10 @@ def main():
                 st.write(f"**Chat ID:** `{selected_chat_id}`")
                 st.write(f"**메시지 수:** {len(chat_df)}개")
             with col2:
+                # personType이 categorical이라 value_counts가 0건 카테고리도 포함하므로
+                # 실제 등장한 참여자만 보여준다
                 person_types = chat_df['personType'].value_counts()
+                person_types = person_types[person_types > 0]
                 st.write("**참여자:**")
                 for pt, cnt in person_types.items():
                     st.write(f"- {pt}: {cnt}개")
@@ -221,16 +253,38 @@ def main():
         # 대화 내용 표시
         st.subheader("💬 대화 내용")
         
-        # 각 메시지 표시
-        for _, msg in chat_df.iterrows():
-            workflow_info = msg.get('workflow_info') if 'workflow_info' in chat_df.columns else None
-            html = format_message_html(
-                msg['personType'],
-                msg['created_at'],
-                msg['plainText'],
-                workflow_info
+        # 메시지가 많은 대화방은 페이지 단위로 잘라 브라우저 DOM 작업량을 상한한다
+        page_size = 50
+        total = len(chat_df)
+        if total > page_size:
+            page_count = (total + page_size - 1) // page_size
+            page = st.number_input(
+                f"페이지 (총 {page_count}페이지, {page_size}개씩)",
+                min_value=1,
+                max_value=page_count,
+                value=1,
+                key=f"chat_page_{selected_chat_id}",
+            )
+            page_df = chat_df.iloc[(page - 1) * page_size : page * page_size]
+        else:
+            page_df = chat_df
+        
+        # iterrows(행→Series 변환)와 메시지당 st.markdown 호출 대신
+        # 컬럼 리스트를 zip으로 돌고 HTML을 한 번에 내보낸다
+        if 'workflow_info' in page_df.columns:
+            workflow_values = page_df['workflow_info'].tolist()
+        else:
+            workflow_values = [None] * len(page_df)
+        fragments = [
+            format_message_html(person_type, created_at, plain_text, workflow_info)
+            for person_type, created_at, plain_text, workflow_info in zip(
+                page_df['personType'].tolist(),
+                page_df['created_at'].tolist(),
+                page_df['plainText'].tolist(),
+                workflow_values,
             )
-            st.markdown(html, unsafe_allow_html=True)
+        ]
+        st.markdown(''.join(fragments), unsafe_allow_html=True)
         
         # 원본 데이터 테이블 (접을 수 있게)
         with st.expander("📊 원본 데이터 테이블"):
@@ -245,4 +299,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
@@ -2,6 +2,13 @@
 import os
 import json
 from pathlib import Path
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson 미설치 환경
+    _json_loads = json.loads
 from typing import List, Dict, Any, Optional
 from google.cloud import bigquery
 from google.oauth2 import service_account
@@ -56,105 +63,137 @@ class BigQueryClient:
             bq_table = os.getenv("BQ_TABLE", "messages")
             self.table_full_name = f"{bq_project}.{bq_dataset}.{bq_table}"
         
+        # Storage API가 있으면 결과를 Arrow 스트림으로 병렬 수신해 to_dataframe가 훨씬 빠르다
+        try:
+            from google.cloud import bigquery_storage
+
+            self._bqstorage_client = bigquery_storage.BigQueryReadClient(credentials=credentials)
+        except ImportError:  # google-cloud-bigquery-storage 미설치 환경
+            self._bqstorage_client = None
+        
         # 디버깅용: 사용 중인 테이블명 출력
         import logging
         logger = logging.getLogger(__name__)
         logger.info(f"BigQuery 테이블 사용: {self.table_full_name}")
     
-    def _extract_text_from_blocks(self, df: pd.DataFrame) -> pd.DataFrame:
-        """blocks 필드에서 텍스트 추출 및 워크플로우 정보 처리"""
-        def extract_text(row):
-            # plainText가 있으면 그대로 사용
-            if pd.notna(row['plainText']) and row['plainText'] != '':
-                return row['plainText']
-            
-            # blocks에서 텍스트 추출
-            if pd.notna(row.get('blocks')):
-                try:
-                    blocks = row['blocks']
-                    # JSON 문자열인 경우 파싱
-                    if isinstance(blocks, str):
-                        blocks = json.loads(blocks)
-                    
-                    if isinstance(blocks, list):
-                        texts = []
-                        for block in blocks:
-                            if isinstance(block, dict):
-                                # blocks 구조: [{"type": "text", "value": "..."}]
-                                if 'value' in block:
-                                    texts.append(str(block['value']))
-                                elif 'text' in block:
-                                    texts.append(str(block['text']))
-                                elif 'content' in block:
-                                    texts.append(str(block['content']))
-                        if texts:
-                            return '\n'.join(texts)
-                except Exception as e:
-                    # 파싱 실패 시 로그 (선택사항)
-                    pass
-            
-            # plainText와 blocks가 모두 없으면 시스템 메시지 내용 생성
-            system_msg = self._format_system_message(row)
-            return system_msg
+    def _run_query(self, query: str, job_config: Optional[bigquery.QueryJobConfig] = None) -> pd.DataFrame:
+        """쿼리를 실행해 DataFrame으로 받는다 (가능하면 Storage API 경유)."""
+        results = self.client.query(query, job_config=job_config).result()
+        if self._bqstorage_client is not None:
+            df = results.to_dataframe(bqstorage_client=self._bqstorage_client)
+        else:
+            df = results.to_dataframe()
         
-        def format_workflow_info(row):
-            """워크플로우 정보 포맷팅"""
-            info_parts = []
-            
-            # workflow 정보
-            if pd.notna(row.get('workflow')):
-                try:
-                    workflow = row['workflow']
-                    if isinstance(workflow, str):
-                        workflow = json.loads(workflow)
-                    if isinstance(workflow, dict):
-                        workflow_str = f"워크플로우: {workflow.get('id', 'N/A')} (섹션: {workflow.get('sectionId', 'N/A')})"
-                        info_parts.append(workflow_str)
-                except:
-                    pass
-            
-            # log 정보
-            if pd.notna(row.get('log')):
-                try:
-                    log = row['log']
-                    if isinstance(log, str):
-                        log = json.loads(log)
-                    if isinstance(log, dict):
-                        log_str = f"액션: {log.get('action', 'N/A')}"
-                        if log.get('triggerType'):
-                            log_str += f" (트리거: {log.get('triggerType')})"
-                        info_parts.append(log_str)
-                except:
-                    pass
-            
-            # options 정보
-            if pd.notna(row.get('options')):
-                try:
-                    options = row['options']
-                    if isinstance(options, str):
-                        options = json.loads(options)
-                    if isinstance(options, list) and options:
-                        info_parts.append(f"옵션: {', '.join(options)}")
-                except:
-                    pass
-            
-            return ' | '.join(info_parts) if info_parts else None
+        # 고유값이 행 수보다 훨씬 적은 키 컬럼은 카테고리로 바꿔
+        # 비교/value_counts/groupby가 문자열 해시 대신 정수 코드로 돌게 한다
+        for column in ('personType', 'chatId'):
+            if column in df.columns:
+                df[column] = df[column].astype('category')
         
-        if 'blocks' in df.columns:
-            # extract_text 내부에서 _format_system_message를 호출하므로 여기서는 그대로 사용
-            df['plainText'] = df.apply(extract_text, axis=1)
-        else:
-            # blocks 컬럼이 없는 경우 (get_today_messages 등)
-            df['plainText'] = df.apply(
-                lambda row: self._format_system_message(row) if (pd.isna(row['plainText']) or row['plainText'] == '') else row['plainText'], 
-                axis=1
-            )
+        # 서버측 ORDER BY는 단일 워커 정렬 단계를 강제하므로 클라이언트에서 한 번만 정렬한다
+        if 'chatId' in df.columns and 'created_at' in df.columns:
+            df.sort_values(['chatId', 'created_at'], inplace=True, kind='mergesort', ignore_index=True)
+        return df
+    
+    # blocks JSON에서 텍스트 추출을 쿼리 엔진(C++)에서 수행해
+    # 클라이언트의 행 단위 json.loads 비용을 없앤다.
+    # 블록 구조: [{"type": "text", "value": "..."}] (value/text/content 중 하나)
+    PLAIN_TEXT_SQL = """COALESCE(
+            NULLIF(m.plainText, ''),
+            NULLIF(ARRAY_TO_STRING(ARRAY(
+                SELECT COALESCE(
+                    JSON_EXTRACT_SCALAR(b, '$.value'),
+                    JSON_EXTRACT_SCALAR(b, '$.text'),
+                    JSON_EXTRACT_SCALAR(b, '$.content')
+                )
+                FROM UNNEST(JSON_EXTRACT_ARRAY(m.blocks)) AS b
+            ), '\\n'), '')
+        ) AS plainText"""
+
+    def _extract_text_from_blocks(self, df: pd.DataFrame) -> pd.DataFrame:
+        """SQL에서 추출된 plainText의 빈 값을 시스템 메시지로 채우고 워크플로우 정보를 붙인다"""
+        # 전체 행 apply 대신 빈 행 부분집합에만 시스템 메시지 포맷터를 돌린다.
+        # log/workflow/options가 전부 비어 있으면 포맷터 결과가 상수이므로
+        # 세 컬럼의 notna 마스크를 먼저 묶어 포맷터 호출 대상을 더 좁힌다.
+        need = df['plainText'].fillna('').eq('')
+        if need.any():
+            has_detail = pd.Series(False, index=df.index)
+            for column in ('log', 'workflow', 'options'):
+                if column in df.columns:
+                    has_detail |= df[column].notna()
+            detail_rows = need & has_detail
+            if detail_rows.any():
+                df.loc[detail_rows, 'plainText'] = df.loc[detail_rows].apply(
+                    self._format_system_message, axis=1
+                )
+            df.loc[need & ~has_detail, 'plainText'] = '[시스템 메시지]'
         
-        # 워크플로우 정보 추가
-        df['workflow_info'] = df.apply(format_workflow_info, axis=1)
+        # 워크플로우 정보는 행 순회 대신 컬럼 단위 map으로 만든다
+        parts = [
+            df[column].map(formatter)
+            for column, formatter in (
+                ('workflow', self._workflow_summary),
+                ('log', self._log_summary),
+                ('options', self._options_summary),
+            )
+            if column in df.columns
+        ]
+        if parts:
+            df['workflow_info'] = [
+                ' | '.join(part for part in row_parts if part) or None
+                for row_parts in zip(*(part.tolist() for part in parts))
+            ]
+        else:
+            # workflow/log/options 컬럼이 없는 경우 (get_today_messages 등)
+            df['workflow_info'] = None
         
         return df
     
+    @staticmethod
+    def _workflow_summary(value) -> Optional[str]:
+        """workflow 셀 하나를 요약 문자열로 변환"""
+        if value is None or (isinstance(value, float) and pd.isna(value)):
+            return None
+        try:
+            if isinstance(value, str):
+                value = _json_loads(value)
+            if isinstance(value, dict):
+                return f"워크플로우: {value.get('id', 'N/A')} (섹션: {value.get('sectionId', 'N/A')})"
+        except Exception:
+            pass
+        return None
+    
+    @staticmethod
+    def _log_summary(value) -> Optional[str]:
+        """log 셀 하나를 요약 문자열로 변환"""
+        if value is None or (isinstance(value, float) and pd.isna(value)):
+            return None
+        try:
+            if isinstance(value, str):
+                value = _json_loads(value)
+            if isinstance(value, dict):
+                log_str = f"액션: {value.get('action', 'N/A')}"
+                if value.get('triggerType'):
+                    log_str += f" (트리거: {value.get('triggerType')})"
+                return log_str
+        except Exception:
+            pass
+        return None
+    
+    @staticmethod
+    def _options_summary(value) -> Optional[str]:
+        """options 셀 하나를 요약 문자열로 변환"""
+        if value is None or (isinstance(value, float) and pd.isna(value)):
+            return None
+        try:
+            if isinstance(value, str):
+                value = _json_loads(value)
+            if isinstance(value, list) and value:
+                return f"옵션: {', '.join(value)}"
+        except Exception:
+            pass
+        return None
+    
     def _format_system_message(self, row) -> str:
         """시스템 메시지 내용 포맷팅"""
         parts = []
@@ -167,7 +206,7 @@ class BigQueryClient:
                 if isinstance(log, str):
                     # JSON 문자열인 경우 파싱
                     if log.startswith('{') or log.startswith('['):
-                        log = json.loads(log)
+                        log = _json_loads(log)
                     else:
                         # 일반 문자열인 경우 그대로 사용
                         parts.append(f"로그: {log}")
@@ -198,7 +237,7 @@ class BigQueryClient:
             try:
                 workflow = row['workflow']
                 if isinstance(workflow, str):
-                    workflow = json.loads(workflow)
+                    workflow = _json_loads(workflow)
                 if isinstance(workflow, dict):
                     workflow_id = workflow.get('id', '')
                     section_id = workflow.get('sectionId', '')
@@ -221,7 +260,7 @@ class BigQueryClient:
                 if isinstance(options, str):
                     # JSON 배열 문자열인 경우 파싱
                     if options.startswith('['):
-                        options = json.loads(options)
+                        options = _json_loads(options)
                     else:
                         options = [options]
                 
@@ -245,18 +284,13 @@ class BigQueryClient:
             m.chatId,
             TIMESTAMP_MILLIS(m.createdAt) AS created_at,
             m.personType,
-            m.plainText,
-            m.blocks
+            {self.PLAIN_TEXT_SQL}
         FROM `{self.table_full_name}` m
-        WHERE DATE(TIMESTAMP_MILLIS(m.createdAt)) = CURRENT_DATE()
-        ORDER BY m.chatId, m.createdAt ASC
+        WHERE m.createdAt >= UNIX_MILLIS(TIMESTAMP(CURRENT_DATE()))
+          AND m.createdAt < UNIX_MILLIS(TIMESTAMP(DATE_ADD(CURRENT_DATE(), INTERVAL 1 DAY)))
         """
         
-        query_job = self.client.query(query)
-        results = query_job.result()
-        df = results.to_dataframe()
-        
-        return self._extract_text_from_blocks(df)
+        return self._extract_text_from_blocks(self._run_query(query))
     
     def get_messages_by_date(self, target_date: str) -> pd.DataFrame:
         """특정 날짜의 모든 메시지 가져오기"""
@@ -266,14 +300,13 @@ class BigQueryClient:
             m.chatId,
             TIMESTAMP_MILLIS(m.createdAt) AS created_at,
             m.personType,
-            m.plainText,
-            m.blocks,
+            {self.PLAIN_TEXT_SQL},
             m.workflow,
             m.log,
             m.options
         FROM `{self.table_full_name}` m
-        WHERE DATE(TIMESTAMP_MILLIS(m.createdAt)) = @target_date
-        ORDER BY m.chatId, m.createdAt ASC
+        WHERE m.createdAt >= UNIX_MILLIS(TIMESTAMP(@target_date))
+          AND m.createdAt < UNIX_MILLIS(TIMESTAMP(DATE_ADD(@target_date, INTERVAL 1 DAY)))
         """
         
         job_config = bigquery.QueryJobConfig(
@@ -282,11 +315,7 @@ class BigQueryClient:
             ]
         )
         
-        query_job = self.client.query(query, job_config=job_config)
-        results = query_job.result()
-        df = results.to_dataframe()
-        
-        return self._extract_text_from_blocks(df)
+        return self._extract_text_from_blocks(self._run_query(query, job_config))
     
     def get_messages_by_month(self, year: int, month: int, limit_chats: int = 50) -> pd.DataFrame:
         """특정 월에 메시지가 있는 대화방의 전체 메시지 가져오기"""
@@ -301,8 +330,8 @@ class BigQueryClient:
         WITH chats_in_month AS (
           SELECT DISTINCT chatId
           FROM `{self.table_full_name}`
-          WHERE DATE(TIMESTAMP_MILLIS(createdAt)) >= @start_date
-            AND DATE(TIMESTAMP_MILLIS(createdAt)) < @end_date
+          WHERE createdAt >= UNIX_MILLIS(TIMESTAMP(@start_date))
+            AND createdAt < UNIX_MILLIS(TIMESTAMP(@end_date))
           LIMIT @limit_chats
         )
         SELECT
@@ -310,14 +339,12 @@ class BigQueryClient:
             m.chatId,
             TIMESTAMP_MILLIS(m.createdAt) AS created_at,
             m.personType,
-            m.plainText,
-            m.blocks,
+            {self.PLAIN_TEXT_SQL},
             m.workflow,
             m.log,
             m.options
         FROM `{self.table_full_name}` m
         INNER JOIN chats_in_month cim ON m.chatId = cim.chatId
-        ORDER BY m.chatId, m.createdAt ASC
         """
         
         job_config = bigquery.QueryJobConfig(
@@ -328,19 +355,19 @@ class BigQueryClient:
             ]
         )
         
-        query_job = self.client.query(query, job_config=job_config)
-        results = query_job.result()
-        df = results.to_dataframe()
-        
-        return self._extract_text_from_blocks(df)
+        return self._extract_text_from_blocks(self._run_query(query, job_config))
     
     def get_messages_by_keyword(self, keyword: str, limit_chats: int = 10) -> pd.DataFrame:
         """키워드가 언급된 대화방의 전체 메시지 가져오기"""
         query = f"""
         WITH matching_chats AS (
           SELECT DISTINCT chatId
-          FROM `{self.table_full_name}`
-          WHERE LOWER(COALESCE(plainText, TO_JSON_STRING(blocks), '')) LIKE LOWER(@keyword)
+          FROM `{self.table_full_name}` AS t
+          -- SEARCH는 토큰 기반 대소문자 무시 매칭으로, 행마다 LOWER+TO_JSON_STRING을
+          -- 만들던 기존 LIKE 스캔을 대체한다. 메시지 본문 컬럼으로 범위를 한정해야
+          -- id/personType/log 등 다른 STRING 컬럼이 엉뚱하게 매칭되지 않고,
+          -- 검색 인덱스(CREATE SEARCH INDEX ... ON ...(plainText, blocks))도 탈 수 있다.
+          WHERE SEARCH((t.plainText, t.blocks), @keyword)
           LIMIT @limit_chats
         )
         SELECT
@@ -348,26 +375,20 @@ class BigQueryClient:
             m.chatId,
             TIMESTAMP_MILLIS(m.createdAt) AS created_at,
             m.personType,
-            m.plainText,
-            m.blocks,
+            {self.PLAIN_TEXT_SQL},
             m.workflow,
             m.log,
             m.options
         FROM `{self.table_full_name}` m
         INNER JOIN matching_chats mc ON m.chatId = mc.chatId
-        ORDER BY m.chatId, m.createdAt ASC
         """
         
         job_config = bigquery.QueryJobConfig(
             query_parameters=[
-                bigquery.ScalarQueryParameter("keyword", "STRING", f"%{keyword}%"),
+                bigquery.ScalarQueryParameter("keyword", "STRING", keyword),
                 bigquery.ScalarQueryParameter("limit_chats", "INT64", limit_chats)
             ]
         )
         
-        query_job = self.client.query(query, job_config=job_config)
-        results = query_job.result()
-        df = results.to_dataframe()
-        
-        return self._extract_text_from_blocks(df)
+        return self._extract_text_from_blocks(self._run_query(query, job_config))
 
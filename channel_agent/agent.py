@@ -1,8 +1,16 @@
+import asyncio
 import json
 import logging
 from typing import Any, Dict, List, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson 미설치 환경
+    _json_loads = json.loads
 
 from .channel_api import ChannelTalkClient
 from .config import OpenAIConfig
@@ -22,13 +30,12 @@ def _safe_content_to_text(content: Any) -> str:
     if isinstance(content, str):
         return content
     if isinstance(content, list):
-        texts: List[str] = []
-        for item in content:
-            if isinstance(item, dict) and "text" in item:
-                texts.append(item.get("text") or "")
-            elif isinstance(item, str):
-                texts.append(item)
-        return "\n".join(texts)
+        # 중간 리스트 append 루프 대신 제너레이터를 바로 join에 넘긴다
+        return "\n".join(
+            (item.get("text") or "") if isinstance(item, dict) else item
+            for item in content
+            if (isinstance(item, dict) and "text" in item) or isinstance(item, str)
+        )
     return str(content)
 
 
@@ -40,6 +47,7 @@ class ChannelAgent:
         self.config = oa_config
         self.tool_client = tool_client
         self.client = OpenAI(api_key=oa_config.api_key)
+        self.aclient = AsyncOpenAI(api_key=oa_config.api_key)
         self._agent_id: Optional[str] = None
 
     @property
@@ -135,11 +143,41 @@ class ChannelAgent:
             agent_id=active_agent_id,
             messages=[{"role": "user", "content": dialog_text}],
         )
+        return self._parse_agent_response(response)
+
+    async def summarize_batch(
+        self,
+        dialogs: List[str],
+        agent_id: Optional[str] = None,
+        concurrency: int = 16,
+    ) -> List[Dict[str, Any]]:
+        """여러 대화를 동시 요청으로 요약/라벨링한다 (결과는 입력 순서 보존).
+
+        호출은 네트워크 대기가 대부분이므로 semaphore로 동시성만 제한하고
+        asyncio.gather로 묶어 보낸다.
+        """
+        active_agent_id = agent_id or self.agent_id
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(dialog_text: str) -> Dict[str, Any]:
+            if not dialog_text:
+                raise ValueError("dialog_text is empty")
+            async with semaphore:
+                response = await self.aclient.beta.v2.chat.completions.create(
+                    agent_id=active_agent_id,
+                    messages=[{"role": "user", "content": dialog_text}],
+                )
+            return self._parse_agent_response(response)
+
+        return list(await asyncio.gather(*(one(dialog) for dialog in dialogs)))
+
+    @staticmethod
+    def _parse_agent_response(response: Any) -> Dict[str, Any]:
         message = response.choices[0].message
         content_text = _safe_content_to_text(message.content)
         try:
-            parsed = json.loads(content_text)
-        except json.JSONDecodeError:
+            parsed = _json_loads(content_text)
+        except ValueError:  # orjson/json 모두 ValueError 계열을 던진다
             logger.warning("Agent responded with non-JSON; wrapping as fallback")
             parsed = {"summary": content_text, "labels": [], "emotion": ""}
         return parsed
@@ -1,11 +1,215 @@
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 from .config import ChannelTalkConfig
 
 logger = logging.getLogger(__name__)
 
 
+# 목 데이터: 다양한 환불/배송/강사 문의/기능 제안
+_MOCK_USER_CHATS = (
+    # 1) 수강 환불/불만 다양한 케이스
+    {"id": "chat_001", "userId": "user_100", "name": "홍길동", "description": "배송 문의", "state": "open", "openedAt": "2024-08-01T09:00:00Z", "closedAt": None, "tags": ["배송", "일반문의"], "chatUrl": "https://open.channel.io/chats/chat_001"},
+    {"id": "chat_002", "userId": "user_101", "name": "김영희", "description": "환불 요청", "state": "closed", "openedAt": "2024-08-02T11:00:00Z", "closedAt": "2024-08-02T12:00:00Z", "tags": ["환불", "결제"], "chatUrl": "https://open.channel.io/chats/chat_002"},
+    {"id": "chat_003", "userId": "user_102", "name": "박민수", "description": "만족도 낮음, UI 불편", "state": "open", "openedAt": "2024-08-03T08:00:00Z", "closedAt": None, "tags": ["환불", "uiux"], "chatUrl": "https://open.channel.io/chats/chat_003"},
+    {"id": "chat_004", "userId": "user_103", "name": "이지은", "description": "가격이 너무 비쌈", "state": "open", "openedAt": "2024-08-03T10:00:00Z", "closedAt": None, "tags": ["환불", "가격"], "chatUrl": "https://open.channel.io/chats/chat_004"},
+    {"id": "chat_017", "userId": "user_116", "name": "최은지", "description": "배송이 지연됨", "state": "open", "openedAt": "2024-08-06T12:00:00Z", "closedAt": None, "tags": ["배송", "지연"], "chatUrl": "https://open.channel.io/chats/chat_017"},
+
+    # 2) 도서 상품/배송/반품
+    {"id": "chat_005", "userId": "user_104", "name": "최서연", "description": "도서 배송 확인", "state": "open", "openedAt": "2024-08-04T09:30:00Z", "closedAt": None, "tags": ["도서", "배송"], "chatUrl": "https://open.channel.io/chats/chat_005"},
+    {"id": "chat_006", "userId": "user_105", "name": "윤정호", "description": "도서 반품 문의", "state": "open", "openedAt": "2024-08-04T10:00:00Z", "closedAt": None, "tags": ["도서", "반품"], "chatUrl": "https://open.channel.io/chats/chat_006"},
+    {"id": "chat_007", "userId": "user_106", "name": "오하늘", "description": "배송 주소 변경", "state": "open", "openedAt": "2024-08-04T11:00:00Z", "closedAt": None, "tags": ["도서", "배송", "주소"], "chatUrl": "https://open.channel.io/chats/chat_007"},
+    {"id": "chat_018", "userId": "user_117", "name": "이도연", "description": "책 반품 요청", "state": "open", "openedAt": "2024-08-06T13:00:00Z", "closedAt": None, "tags": ["도서", "반품"], "chatUrl": "https://open.channel.io/chats/chat_018"},
+
+    # 3) 강사별 수강/환불 문의 (실명 3명 x 2개 상품)
+    {"id": "chat_008", "userId": "user_107", "name": "강도현", "description": "정원규 코스1 환불", "state": "open", "openedAt": "2024-08-05T09:00:00Z", "closedAt": None, "tags": ["정원규", "코스1", "환불"], "chatUrl": "https://open.channel.io/chats/chat_008"},
+    {"id": "chat_009", "userId": "user_108", "name": "백승우", "description": "정원규 코스2 문의", "state": "open", "openedAt": "2024-08-05T09:30:00Z", "closedAt": None, "tags": ["정원규", "코스2", "수강문의"], "chatUrl": "https://open.channel.io/chats/chat_009"},
+    {"id": "chat_010", "userId": "user_109", "name": "문하린", "description": "조유식 코스1 환불", "state": "open", "openedAt": "2024-08-05T10:00:00Z", "closedAt": None, "tags": ["조유식", "코스1", "환불"], "chatUrl": "https://open.channel.io/chats/chat_010"},
+    {"id": "chat_011", "userId": "user_110", "name": "신유진", "description": "조유식 코스2 수강문의", "state": "open", "openedAt": "2024-08-05T10:30:00Z", "closedAt": None, "tags": ["조유식", "코스2", "수강문의"], "chatUrl": "https://open.channel.io/chats/chat_011"},
+    {"id": "chat_012", "userId": "user_111", "name": "정호진", "description": "김현지 코스1 환불", "state": "open", "openedAt": "2024-08-05T11:00:00Z", "closedAt": None, "tags": ["김현지", "코스1", "환불"], "chatUrl": "https://open.channel.io/chats/chat_012"},
+    {"id": "chat_013", "userId": "user_112", "name": "서윤아", "description": "김현지 코스2 문의", "state": "open", "openedAt": "2024-08-05T11:30:00Z", "closedAt": None, "tags": ["김현지", "코스2", "수강문의"], "chatUrl": "https://open.channel.io/chats/chat_013"},
+    {"id": "chat_019", "userId": "user_118", "name": "장은호", "description": "정원규 코스1 만족도 낮음 환불 고민", "state": "open", "openedAt": "2024-08-06T14:00:00Z", "closedAt": None, "tags": ["정원규", "코스1", "환불"], "chatUrl": "https://open.channel.io/chats/chat_019"},
+
+    # 4) 기능 제안
+    {"id": "chat_014", "userId": "user_113", "name": "추가요청1", "description": "스크립트 제공 요청", "state": "open", "openedAt": "2024-08-06T08:00:00Z", "closedAt": None, "tags": ["제안", "스크립트"], "chatUrl": "https://open.channel.io/chats/chat_014"},
+    {"id": "chat_015", "userId": "user_114", "name": "추가요청2", "description": "다크모드 필요", "state": "open", "openedAt": "2024-08-06T09:00:00Z", "closedAt": None, "tags": ["제안", "다크모드"], "chatUrl": "https://open.channel.io/chats/chat_015"},
+    {"id": "chat_016", "userId": "user_115", "name": "추가요청3", "description": "모바일 최적화 제안", "state": "open", "openedAt": "2024-08-06T10:00:00Z", "closedAt": None, "tags": ["제안", "모바일"], "chatUrl": "https://open.channel.io/chats/chat_016"},
+    # 5) 긴/모호 대화 시나리오
+    {"id": "chat_020", "userId": "user_119", "name": "김도형", "description": "강사B 코스1 길이/품질 관련 고민", "state": "open", "openedAt": "2024-08-07T09:00:00Z", "closedAt": None, "tags": ["강사B", "코스1", "품질", "불만"], "chatUrl": "https://open.channel.io/chats/chat_020"},
+    {"id": "chat_021", "userId": "user_120", "name": "박지현", "description": "환불인지 기능 제안인지 모호한 요청", "state": "open", "openedAt": "2024-08-07T10:00:00Z", "closedAt": None, "tags": ["환불", "제안"], "chatUrl": "https://open.channel.io/chats/chat_021"},
+    {"id": "chat_022", "userId": "user_121", "name": "서지안", "description": "도서/강의 섞인 문의와 기능 요청", "state": "open", "openedAt": "2024-08-07T11:00:00Z", "closedAt": None, "tags": ["도서", "강의", "제안"], "chatUrl": "https://open.channel.io/chats/chat_022"},
+    # 6) 욕설/공격적 표현 포함 케이스
+    {"id": "chat_023", "userId": "user_122", "name": "공격적유저", "description": "욕설/비속어 포함 불만", "state": "open", "openedAt": "2024-08-07T12:00:00Z", "closedAt": None, "tags": ["불만", "욕설"], "chatUrl": "https://open.channel.io/chats/chat_023"},
+)
+
+# 호출마다 목 리스트와 응답 딕셔너리를 다시 만들지 않도록 읽기 전용 뷰를 공유한다.
+# MappingProxyType이라 키 추가/삭제가 막혀 호출자가 스냅샷을 실수로 바꾸지 못한다.
+_MOCK_CHAT_LIST_RESPONSE = MappingProxyType(
+    {
+        "userChats": _MOCK_USER_CHATS,
+        "nextCursor": None,
+    }
+)
+
+
+# 목 데이터 상수: 호출마다 수십 개의 중첩 딕셔너리/리스트 리터럴을 다시 할당하지
+# 않도록 모듈 로드 시 한 번만 만든다. 반환값은 호출 간 공유되므로 수정하지 않는다.
+_META_MAP = {
+    "chat_001": {"name": "홍길동", "description": "배송 문의", "tags": ["배송"]},
+    "chat_002": {"name": "김영희", "description": "환불 요청", "tags": ["환불", "결제"]},
+    "chat_003": {"name": "박민수", "description": "만족도 낮음, UI 불편", "tags": ["환불", "uiux"]},
+    "chat_004": {"name": "이지은", "description": "가격 불만", "tags": ["환불", "가격"]},
+    "chat_017": {"name": "최은지", "description": "배송 지연", "tags": ["배송", "지연"]},
+    "chat_005": {"name": "최서연", "description": "도서 배송 확인", "tags": ["도서", "배송"]},
+    "chat_006": {"name": "윤정호", "description": "도서 반품", "tags": ["도서", "반품"]},
+    "chat_007": {"name": "오하늘", "description": "배송 주소 변경", "tags": ["도서", "배송", "주소"]},
+    "chat_018": {"name": "이도연", "description": "책 반품 요청", "tags": ["도서", "반품"]},
+    "chat_008": {"name": "강도현", "description": "정원규 코스1 환불", "tags": ["정원규", "코스1", "환불"]},
+    "chat_009": {"name": "백승우", "description": "정원규 코스2 문의", "tags": ["정원규", "코스2", "수강문의"]},
+    "chat_010": {"name": "문하린", "description": "조유식 코스1 환불", "tags": ["조유식", "코스1", "환불"]},
+    "chat_011": {"name": "신유진", "description": "조유식 코스2 수강문의", "tags": ["조유식", "코스2", "수강문의"]},
+    "chat_012": {"name": "정호진", "description": "김현지 코스1 환불", "tags": ["김현지", "코스1", "환불"]},
+    "chat_013": {"name": "서윤아", "description": "김현지 코스2 문의", "tags": ["김현지", "코스2", "수강문의"]},
+    "chat_019": {"name": "장은호", "description": "정원규 코스1 불만/환불 고민", "tags": ["정원규", "코스1", "환불"]},
+    "chat_014": {"name": "추가요청1", "description": "스크립트 제공 요청", "tags": ["제안", "스크립트"]},
+    "chat_015": {"name": "추가요청2", "description": "다크모드 필요", "tags": ["제안", "다크모드"]},
+    "chat_016": {"name": "추가요청3", "description": "모바일 최적화", "tags": ["제안", "모바일"]},
+    "chat_020": {"name": "김도형", "description": "강사B 코스1 길이/품질 관련 고민", "tags": ["강사B", "코스1", "품질", "불만"]},
+    "chat_021": {"name": "박지현", "description": "환불인지 기능 제안인지 모호한 요청", "tags": ["환불", "제안"]},
+    "chat_022": {"name": "서지안", "description": "도서/강의 섞인 문의와 기능 요청", "tags": ["도서", "강의", "제안"]},
+}
+
+
+def _build_meta_response(user_chat_id, base):
+    return {
+        "id": user_chat_id,
+        "userId": f"{user_chat_id}_user",
+        "name": base["name"],
+        "description": base["description"],
+        "openedAt": "2024-08-01T09:00:00Z",
+        "closedAt": None,
+        "state": "open",
+        "tags": [{"id": f"tag_{i}", "name": t} for i, t in enumerate(base["tags"], start=1)],
+        "assignee": {"id": "agent_01", "name": "상담원A"},
+        "chatUrl": f"https://open.channel.io/chats/{user_chat_id}",
+    }
+
+
+# 태그 객체 변환까지 끝낸 완성 응답을 import 시점에 미리 조립해 둔다
+_META_RESPONSES = {
+    chat_id: _build_meta_response(chat_id, base) for chat_id, base in _META_MAP.items()
+}
+
+_MESSAGES_MAP = {
+    "chat_001": [
+        {"id": "m1", "personType": "customer", "plainText": "안녕하세요 배송이 언제 되나요? 010-1234-5678", "createdAt": "2024-08-01T09:01:00Z"},
+        {"id": "m2", "personType": "manager", "plainText": "안녕하세요, 오늘 출고 예정입니다.", "createdAt": "2024-08-01T09:02:00Z"},
+    ],
+    "chat_002": [
+        {"id": "m3", "personType": "customer", "plainText": "결제했는데 환불해주세요 계좌 123456789012", "createdAt": "2024-08-02T11:05:00Z"},
+        {"id": "m4", "personType": "manager", "plainText": "확인 후 환불 도와드리겠습니다.", "createdAt": "2024-08-02T11:06:00Z"},
+    ],
+    "chat_003": [
+        {"id": "m5", "personType": "customer", "plainText": "UI 너무 불편하고 로딩이 길어요. 환불 가능할까요? 010 2222 3333", "createdAt": "2024-08-03T08:10:00Z"},
+        {"id": "m6", "personType": "manager", "plainText": "불편을 드려 죄송합니다. 환불 절차 안내드리겠습니다.", "createdAt": "2024-08-03T08:12:00Z"},
+    ],
+    "chat_004": [
+        {"id": "m7", "personType": "customer", "plainText": "가격이 너무 비싸서 만족이 안 됩니다. 환불해주세요.", "createdAt": "2024-08-03T10:05:00Z"},
+        {"id": "m8", "personType": "manager", "plainText": "프로모션 안내드릴까요, 아니면 바로 환불 도와드릴까요?", "createdAt": "2024-08-03T10:06:00Z"},
+    ],
+    "chat_005": [
+        {"id": "m9", "personType": "customer", "plainText": "도서 배송 언제 도착하나요? 이름은 김책사요.", "createdAt": "2024-08-04T09:31:00Z"},
+        {"id": "m10", "personType": "manager", "plainText": "금주 내 도착 예정입니다. 송장 보내드릴게요.", "createdAt": "2024-08-04T09:33:00Z"},
+    ],
+    "chat_006": [
+        {"id": "m11", "personType": "customer", "plainText": "도서가 파손되어 반품하고 싶어요.", "createdAt": "2024-08-04T10:05:00Z"},
+        {"id": "m12", "personType": "manager", "plainText": "불편을 드려 죄송합니다. 수거 접수해드리겠습니다.", "createdAt": "2024-08-04T10:06:00Z"},
+    ],
+    "chat_007": [
+        {"id": "m13", "personType": "customer", "plainText": "배송 주소를 서울 강남구 테헤란로123 5층으로 바꿀 수 있나요?", "createdAt": "2024-08-04T11:05:00Z"},
+        {"id": "m14", "personType": "manager", "plainText": "네 주소 변경 처리했습니다.", "createdAt": "2024-08-04T11:06:00Z"},
+    ],
+    "chat_008": [
+        {"id": "m15", "personType": "customer", "plainText": "정원규 한의학101 내용이 기대와 달라 환불하고 싶어요. 계좌는 987654321098", "createdAt": "2024-08-05T09:01:00Z"},
+        {"id": "m16", "personType": "manager", "plainText": "확인 후 환불 진행하겠습니다.", "createdAt": "2024-08-05T09:02:00Z"},
+    ],
+    "chat_009": [
+        {"id": "m17", "personType": "customer", "plainText": "정원규 한의학101 수강하려고 하는데 난이도가 어떤가요?", "createdAt": "2024-08-05T09:31:00Z"},
+        {"id": "m18", "personType": "manager", "plainText": "중급자 대상이며 예제 코드가 포함되어 있습니다.", "createdAt": "2024-08-05T09:32:00Z"},
+    ],
+    "chat_010": [
+        {"id": "m19", "personType": "customer", "plainText": "조유식 한국무용입문 환불 원합니다. 010-4444-5555로 연락주세요.", "createdAt": "2024-08-05T10:01:00Z"},
+        {"id": "m20", "personType": "manager", "plainText": "전화 없이 바로 환불 처리해드릴까요?", "createdAt": "2024-08-05T10:02:00Z"},
+    ],
+    "chat_011": [
+        {"id": "m21", "personType": "customer", "plainText": "조유식 한국무용입문 라이브 세션 일정이 어떻게 되나요?", "createdAt": "2024-08-05T10:31:00Z"},
+        {"id": "m22", "personType": "manager", "plainText": "매주 수요일 저녁 8시입니다.", "createdAt": "2024-08-05T10:32:00Z"},
+    ],
+    "chat_012": [
+        {"id": "m23", "personType": "customer", "plainText": "김현지 코스1 환불하고 싶어요. 서울 마포구 거주합니다.", "createdAt": "2024-08-05T11:01:00Z"},
+        {"id": "m24", "personType": "manager", "plainText": "확인 후 환불 도와드릴게요.", "createdAt": "2024-08-05T11:02:00Z"},
+    ],
+    "chat_013": [
+        {"id": "m25", "personType": "customer", "plainText": "김현지 코스2에 자막 제공되나요?", "createdAt": "2024-08-05T11:31:00Z"},
+        {"id": "m26", "personType": "manager", "plainText": "네, 자막과 스크립트가 제공됩니다.", "createdAt": "2024-08-05T11:32:00Z"},
+    ],
+    "chat_014": [
+        {"id": "m27", "personType": "customer", "plainText": "강의 스크립트가 있으면 복습이 더 편할 것 같아요.", "createdAt": "2024-08-06T08:05:00Z"},
+        {"id": "m28", "personType": "manager", "plainText": "좋은 제안 감사드립니다. 내부 검토하겠습니다.", "createdAt": "2024-08-06T08:06:00Z"},
+    ],
+    "chat_015": [
+        {"id": "m29", "personType": "customer", "plainText": "다크모드가 꼭 필요해요. 눈이 아파요.", "createdAt": "2024-08-06T09:05:00Z"},
+        {"id": "m30", "personType": "manager", "plainText": "피드백 감사합니다. 로드맵에 반영하겠습니다.", "createdAt": "2024-08-06T09:06:00Z"},
+    ],
+    "chat_016": [
+        {"id": "m31", "personType": "customer", "plainText": "모바일에서 버튼이 너무 작아요. 개선 요청합니다.", "createdAt": "2024-08-06T10:05:00Z"},
+        {"id": "m32", "personType": "manager", "plainText": "모바일 UI 개선 건으로 전달하겠습니다.", "createdAt": "2024-08-06T10:06:00Z"},
+    ],
+    "chat_017": [
+        {"id": "m33", "personType": "customer", "plainText": "주문한 강의 교재가 계속 안 와요. 송장도 없고 시간 오래 걸리네요.", "createdAt": "2024-08-06T12:05:00Z"},
+        {"id": "m34", "personType": "manager", "plainText": "지연 확인 후 송장/도착 예정일 안내드리겠습니다.", "createdAt": "2024-08-06T12:06:00Z"},
+    ],
+    "chat_018": [
+        {"id": "m35", "personType": "customer", "plainText": "책이 생각보다 별로라 반품하고 싶습니다. 주소는 경기 용인시 기흥구 보정동이에요.", "createdAt": "2024-08-06T13:05:00Z"},
+        {"id": "m36", "personType": "manager", "plainText": "수거 접수 도와드리겠습니다. 택배 기사 방문 일정 안내드릴게요.", "createdAt": "2024-08-06T13:06:00Z"},
+    ],
+    "chat_019": [
+        {"id": "m37", "personType": "customer", "plainText": "정원규 한의학101 내용이 기대 이하라서 환불할지 고민 중이에요. 010-7777-8888로 연락 주세요.", "createdAt": "2024-08-06T14:05:00Z"},
+        {"id": "m38", "personType": "manager", "plainText": "불편 드려 죄송합니다. 환불 또는 다른 코스 추천 중 어떤 걸 도와드릴까요?", "createdAt": "2024-08-06T14:06:00Z"},
+    ],
+    "chat_020": [
+        {"id": "m39", "personType": "customer", "plainText": "조유식 한국무용입문 듣고 있는데요, 분량이 생각보다 짧고 예제 코드 품질이 아쉽습니다. 환불까지는 아니지만 뭔가 보완이 되나요?", "createdAt": "2024-08-07T09:05:00Z"},
+        {"id": "m40", "personType": "manager", "plainText": "구체적으로 어떤 부분이 부족했는지 알려주시면 개선에 참고하겠습니다.", "createdAt": "2024-08-07T09:06:00Z"},
+        {"id": "m41", "personType": "customer", "plainText": "실습 파일이 너무 간단하고 챕터도 적어요. 추가 자료를 주시면 좋겠어요.", "createdAt": "2024-08-07T09:07:00Z"},
+        {"id": "m42", "personType": "manager", "plainText": "추가 실습 자료를 이번 주 내로 보내드리고, 필요 시 일부 환불도 가능하도록 검토하겠습니다.", "createdAt": "2024-08-07T09:08:00Z"},
+    ],
+    "chat_021": [
+        {"id": "m43", "personType": "customer", "plainText": "강의가 마음에 들긴 하는데 모바일에서 느리고, 환불할지 개선될 때까지 기다릴지 고민 중이에요.", "createdAt": "2024-08-07T10:05:00Z"},
+        {"id": "m44", "personType": "customer", "plainText": "다크모드와 오프라인 수강 기능이 있으면 환불 안 할 것 같아요. 지금은 불편해서요.", "createdAt": "2024-08-07T10:06:30Z"},
+        {"id": "m45", "personType": "manager", "plainText": "모바일 최적화와 다크모드는 로드맵에 있고, 오프라인 수강은 기술 검토 중입니다. 불편을 드려 죄송합니다.", "createdAt": "2024-08-07T10:08:00Z"},
+        {"id": "m46", "personType": "customer", "plainText": "혹시 환불 규정이 어떻게 되나요? 개선되면 다시 결제할 수도 있어요.", "createdAt": "2024-08-07T10:09:00Z"},
+    ],
+    "chat_022": [
+        {"id": "m47", "personType": "customer", "plainText": "도서와 강의 번들로 샀는데 책 배송이 늦고, 강의는 캡션이 없어서 이해가 어려워요.", "createdAt": "2024-08-07T11:05:00Z"},
+        {"id": "m48", "personType": "customer", "plainText": "반품보다는 캡션/스크립트랑 배송 일정만 확실하면 좋겠어요.", "createdAt": "2024-08-07T11:06:00Z"},
+        {"id": "m49", "personType": "manager", "plainText": "배송 일정 확인 후 공유드리고, 캡션/스크립트 제공 가능 여부도 확인하겠습니다.", "createdAt": "2024-08-07T11:07:00Z"},
+        {"id": "m50", "personType": "customer", "plainText": "필요하면 부분 환불도 가능한가요?", "createdAt": "2024-08-07T11:08:00Z"},
+    ],
+    "chat_023": [
+        {"id": "m51", "personType": "customer", "plainText": "이거 왜 이렇게 느려요 진짜 씨발 뭐 하는 거야? 환불이나 빨리 해줘.", "createdAt": "2024-08-07T12:05:00Z"},
+        {"id": "m52", "personType": "customer", "plainText": "상담원도 전화 안 받고 개나 소나 하는 건가요?", "createdAt": "2024-08-07T12:06:00Z"},
+        {"id": "m53", "personType": "manager", "plainText": "불편을 드려 죄송합니다. 환불 규정 안내드리고 빠르게 처리하겠습니다.", "createdAt": "2024-08-07T12:07:00Z"},
+    ],
+}
+
+# 알려지지 않은 대화 id에 돌려줄 기본 메시지
+_DEFAULT_MESSAGES = [
+    {"id": "m0", "personType": "customer", "plainText": "안녕하세요", "createdAt": "2024-08-01T00:00:00Z"},
+]
+
+
 class ChannelTalkClient:
     """Thin HTTP client for ChannelTalk Open API (v5).
 
@@ -17,16 +221,18 @@ class ChannelTalkClient:
     def __init__(self, config: ChannelTalkConfig):
         config.validate()
         self.config = config
+        # 인증 헤더는 생성 후 변하지 않으므로 요청마다 dict를 새로 만들지 않는다
+        self._cached_headers = {
+            "X-Access-Key": config.access_key,
+            "X-Access-Secret": config.access_secret,
+        }
 
     def _headers(self) -> Dict[str, str]:
-        return {
-            "X-Access-Key": self.config.access_key,
-            "X-Access-Secret": self.config.access_secret,
-        }
+        return self._cached_headers
 
     def fetch_user_chat_list(
         self, created_from: str, created_to: str, cursor: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         logger.debug("Mock fetch chat list %s -> %s cursor=%s", created_from, created_to, cursor)
         # 실제 호출 예시
         # url = f"{self.config.base_url}/open/v5/user-chats"
@@ -37,45 +243,8 @@ class ChannelTalkClient:
         # res.raise_for_status()
         # return res.json()
 
-        # 목 데이터: 다양한 환불/배송/강사 문의/기능 제안
-        mock_user_chats = [
-            # 1) 수강 환불/불만 다양한 케이스
-            {"id": "chat_001", "userId": "user_100", "name": "홍길동", "description": "배송 문의", "state": "open", "openedAt": "2024-08-01T09:00:00Z", "closedAt": None, "tags": ["배송", "일반문의"], "chatUrl": "https://open.channel.io/chats/chat_001"},
-            {"id": "chat_002", "userId": "user_101", "name": "김영희", "description": "환불 요청", "state": "closed", "openedAt": "2024-08-02T11:00:00Z", "closedAt": "2024-08-02T12:00:00Z", "tags": ["환불", "결제"], "chatUrl": "https://open.channel.io/chats/chat_002"},
-            {"id": "chat_003", "userId": "user_102", "name": "박민수", "description": "만족도 낮음, UI 불편", "state": "open", "openedAt": "2024-08-03T08:00:00Z", "closedAt": None, "tags": ["환불", "uiux"], "chatUrl": "https://open.channel.io/chats/chat_003"},
-            {"id": "chat_004", "userId": "user_103", "name": "이지은", "description": "가격이 너무 비쌈", "state": "open", "openedAt": "2024-08-03T10:00:00Z", "closedAt": None, "tags": ["환불", "가격"], "chatUrl": "https://open.channel.io/chats/chat_004"},
-            {"id": "chat_017", "userId": "user_116", "name": "최은지", "description": "배송이 지연됨", "state": "open", "openedAt": "2024-08-06T12:00:00Z", "closedAt": None, "tags": ["배송", "지연"], "chatUrl": "https://open.channel.io/chats/chat_017"},
-
-            # 2) 도서 상품/배송/반품
-            {"id": "chat_005", "userId": "user_104", "name": "최서연", "description": "도서 배송 확인", "state": "open", "openedAt": "2024-08-04T09:30:00Z", "closedAt": None, "tags": ["도서", "배송"], "chatUrl": "https://open.channel.io/chats/chat_005"},
-            {"id": "chat_006", "userId": "user_105", "name": "윤정호", "description": "도서 반품 문의", "state": "open", "openedAt": "2024-08-04T10:00:00Z", "closedAt": None, "tags": ["도서", "반품"], "chatUrl": "https://open.channel.io/chats/chat_006"},
-            {"id": "chat_007", "userId": "user_106", "name": "오하늘", "description": "배송 주소 변경", "state": "open", "openedAt": "2024-08-04T11:00:00Z", "closedAt": None, "tags": ["도서", "배송", "주소"], "chatUrl": "https://open.channel.io/chats/chat_007"},
-            {"id": "chat_018", "userId": "user_117", "name": "이도연", "description": "책 반품 요청", "state": "open", "openedAt": "2024-08-06T13:00:00Z", "closedAt": None, "tags": ["도서", "반품"], "chatUrl": "https://open.channel.io/chats/chat_018"},
-
-            # 3) 강사별 수강/환불 문의 (실명 3명 x 2개 상품)
-            {"id": "chat_008", "userId": "user_107", "name": "강도현", "description": "정원규 코스1 환불", "state": "open", "openedAt": "2024-08-05T09:00:00Z", "closedAt": None, "tags": ["정원규", "코스1", "환불"], "chatUrl": "https://open.channel.io/chats/chat_008"},
-            {"id": "chat_009", "userId": "user_108", "name": "백승우", "description": "정원규 코스2 문의", "state": "open", "openedAt": "2024-08-05T09:30:00Z", "closedAt": None, "tags": ["정원규", "코스2", "수강문의"], "chatUrl": "https://open.channel.io/chats/chat_009"},
-            {"id": "chat_010", "userId": "user_109", "name": "문하린", "description": "조유식 코스1 환불", "state": "open", "openedAt": "2024-08-05T10:00:00Z", "closedAt": None, "tags": ["조유식", "코스1", "환불"], "chatUrl": "https://open.channel.io/chats/chat_010"},
-            {"id": "chat_011", "userId": "user_110", "name": "신유진", "description": "조유식 코스2 수강문의", "state": "open", "openedAt": "2024-08-05T10:30:00Z", "closedAt": None, "tags": ["조유식", "코스2", "수강문의"], "chatUrl": "https://open.channel.io/chats/chat_011"},
-            {"id": "chat_012", "userId": "user_111", "name": "정호진", "description": "김현지 코스1 환불", "state": "open", "openedAt": "2024-08-05T11:00:00Z", "closedAt": None, "tags": ["김현지", "코스1", "환불"], "chatUrl": "https://open.channel.io/chats/chat_012"},
-            {"id": "chat_013", "userId": "user_112", "name": "서윤아", "description": "김현지 코스2 문의", "state": "open", "openedAt": "2024-08-05T11:30:00Z", "closedAt": None, "tags": ["김현지", "코스2", "수강문의"], "chatUrl": "https://open.channel.io/chats/chat_013"},
-            {"id": "chat_019", "userId": "user_118", "name": "장은호", "description": "정원규 코스1 만족도 낮음 환불 고민", "state": "open", "openedAt": "2024-08-06T14:00:00Z", "closedAt": None, "tags": ["정원규", "코스1", "환불"], "chatUrl": "https://open.channel.io/chats/chat_019"},
-
-            # 4) 기능 제안
-            {"id": "chat_014", "userId": "user_113", "name": "추가요청1", "description": "스크립트 제공 요청", "state": "open", "openedAt": "2024-08-06T08:00:00Z", "closedAt": None, "tags": ["제안", "스크립트"], "chatUrl": "https://open.channel.io/chats/chat_014"},
-            {"id": "chat_015", "userId": "user_114", "name": "추가요청2", "description": "다크모드 필요", "state": "open", "openedAt": "2024-08-06T09:00:00Z", "closedAt": None, "tags": ["제안", "다크모드"], "chatUrl": "https://open.channel.io/chats/chat_015"},
-            {"id": "chat_016", "userId": "user_115", "name": "추가요청3", "description": "모바일 최적화 제안", "state": "open", "openedAt": "2024-08-06T10:00:00Z", "closedAt": None, "tags": ["제안", "모바일"], "chatUrl": "https://open.channel.io/chats/chat_016"},
-            # 5) 긴/모호 대화 시나리오
-            {"id": "chat_020", "userId": "user_119", "name": "김도형", "description": "강사B 코스1 길이/품질 관련 고민", "state": "open", "openedAt": "2024-08-07T09:00:00Z", "closedAt": None, "tags": ["강사B", "코스1", "품질", "불만"], "chatUrl": "https://open.channel.io/chats/chat_020"},
-            {"id": "chat_021", "userId": "user_120", "name": "박지현", "description": "환불인지 기능 제안인지 모호한 요청", "state": "open", "openedAt": "2024-08-07T10:00:00Z", "closedAt": None, "tags": ["환불", "제안"], "chatUrl": "https://open.channel.io/chats/chat_021"},
-            {"id": "chat_022", "userId": "user_121", "name": "서지안", "description": "도서/강의 섞인 문의와 기능 요청", "state": "open", "openedAt": "2024-08-07T11:00:00Z", "closedAt": None, "tags": ["도서", "강의", "제안"], "chatUrl": "https://open.channel.io/chats/chat_022"},
-            # 6) 욕설/공격적 표현 포함 케이스
-            {"id": "chat_023", "userId": "user_122", "name": "공격적유저", "description": "욕설/비속어 포함 불만", "state": "open", "openedAt": "2024-08-07T12:00:00Z", "closedAt": None, "tags": ["불만", "욕설"], "chatUrl": "https://open.channel.io/chats/chat_023"},
-        ]
-        return {
-            "userChats": mock_user_chats,
-            "nextCursor": None,
-        }
+        # 목 응답은 모듈 로드 시 한 번 만든 읽기 전용 스냅샷을 공유한다
+        return _MOCK_CHAT_LIST_RESPONSE
 
     def fetch_chat_metadata(self, user_chat_id: str) -> Dict[str, Any]:
         logger.debug("Mock fetch chat metadata for %s", user_chat_id)
@@ -85,44 +254,11 @@ class ChannelTalkClient:
         # res.raise_for_status()
         # return res.json()
 
-        meta_map = {
-            "chat_001": {"name": "홍길동", "description": "배송 문의", "tags": ["배송"]},
-            "chat_002": {"name": "김영희", "description": "환불 요청", "tags": ["환불", "결제"]},
-            "chat_003": {"name": "박민수", "description": "만족도 낮음, UI 불편", "tags": ["환불", "uiux"]},
-            "chat_004": {"name": "이지은", "description": "가격 불만", "tags": ["환불", "가격"]},
-            "chat_017": {"name": "최은지", "description": "배송 지연", "tags": ["배송", "지연"]},
-            "chat_005": {"name": "최서연", "description": "도서 배송 확인", "tags": ["도서", "배송"]},
-            "chat_006": {"name": "윤정호", "description": "도서 반품", "tags": ["도서", "반품"]},
-            "chat_007": {"name": "오하늘", "description": "배송 주소 변경", "tags": ["도서", "배송", "주소"]},
-            "chat_018": {"name": "이도연", "description": "책 반품 요청", "tags": ["도서", "반품"]},
-            "chat_008": {"name": "강도현", "description": "정원규 코스1 환불", "tags": ["정원규", "코스1", "환불"]},
-            "chat_009": {"name": "백승우", "description": "정원규 코스2 문의", "tags": ["정원규", "코스2", "수강문의"]},
-            "chat_010": {"name": "문하린", "description": "조유식 코스1 환불", "tags": ["조유식", "코스1", "환불"]},
-            "chat_011": {"name": "신유진", "description": "조유식 코스2 수강문의", "tags": ["조유식", "코스2", "수강문의"]},
-            "chat_012": {"name": "정호진", "description": "김현지 코스1 환불", "tags": ["김현지", "코스1", "환불"]},
-            "chat_013": {"name": "서윤아", "description": "김현지 코스2 문의", "tags": ["김현지", "코스2", "수강문의"]},
-            "chat_019": {"name": "장은호", "description": "정원규 코스1 불만/환불 고민", "tags": ["정원규", "코스1", "환불"]},
-            "chat_014": {"name": "추가요청1", "description": "스크립트 제공 요청", "tags": ["제안", "스크립트"]},
-            "chat_015": {"name": "추가요청2", "description": "다크모드 필요", "tags": ["제안", "다크모드"]},
-            "chat_016": {"name": "추가요청3", "description": "모바일 최적화", "tags": ["제안", "모바일"]},
-            "chat_020": {"name": "김도형", "description": "강사B 코스1 길이/품질 관련 고민", "tags": ["강사B", "코스1", "품질", "불만"]},
-            "chat_021": {"name": "박지현", "description": "환불인지 기능 제안인지 모호한 요청", "tags": ["환불", "제안"]},
-            "chat_022": {"name": "서지안", "description": "도서/강의 섞인 문의와 기능 요청", "tags": ["도서", "강의", "제안"]},
-        }
-        base = meta_map.get(user_chat_id, {"name": "고객", "description": "문의", "tags": []})
-        tag_objs = [{"id": f"tag_{i}", "name": t} for i, t in enumerate(base["tags"], start=1)]
-        return {
-            "id": user_chat_id,
-            "userId": f"{user_chat_id}_user",
-            "name": base["name"],
-            "description": base["description"],
-            "openedAt": "2024-08-01T09:00:00Z",
-            "closedAt": None,
-            "state": "open",
-            "tags": tag_objs,
-            "assignee": {"id": "agent_01", "name": "상담원A"},
-            "chatUrl": f"https://open.channel.io/chats/{user_chat_id}",
-        }
+        # 호출마다 응답 딕셔너리를 다시 조립하지 않고 미리 만든 응답을 공유한다
+        cached = _META_RESPONSES.get(user_chat_id)
+        if cached is not None:
+            return cached
+        return _build_meta_response(user_chat_id, {"name": "고객", "description": "문의", "tags": []})
 
     def fetch_chat_messages(
         self, user_chat_id: str, limit: int = 100, cursor: Optional[str] = None
@@ -137,113 +273,30 @@ class ChannelTalkClient:
         # res.raise_for_status()
         # return res.json()
 
-        messages_map = {
-            "chat_001": [
-                {"id": "m1", "personType": "customer", "plainText": "안녕하세요 배송이 언제 되나요? 010-1234-5678", "createdAt": "2024-08-01T09:01:00Z"},
-                {"id": "m2", "personType": "manager", "plainText": "안녕하세요, 오늘 출고 예정입니다.", "createdAt": "2024-08-01T09:02:00Z"},
-            ],
-            "chat_002": [
-                {"id": "m3", "personType": "customer", "plainText": "결제했는데 환불해주세요 계좌 123456789012", "createdAt": "2024-08-02T11:05:00Z"},
-                {"id": "m4", "personType": "manager", "plainText": "확인 후 환불 도와드리겠습니다.", "createdAt": "2024-08-02T11:06:00Z"},
-            ],
-            "chat_003": [
-                {"id": "m5", "personType": "customer", "plainText": "UI 너무 불편하고 로딩이 길어요. 환불 가능할까요? 010 2222 3333", "createdAt": "2024-08-03T08:10:00Z"},
-                {"id": "m6", "personType": "manager", "plainText": "불편을 드려 죄송합니다. 환불 절차 안내드리겠습니다.", "createdAt": "2024-08-03T08:12:00Z"},
-            ],
-            "chat_004": [
-                {"id": "m7", "personType": "customer", "plainText": "가격이 너무 비싸서 만족이 안 됩니다. 환불해주세요.", "createdAt": "2024-08-03T10:05:00Z"},
-                {"id": "m8", "personType": "manager", "plainText": "프로모션 안내드릴까요, 아니면 바로 환불 도와드릴까요?", "createdAt": "2024-08-03T10:06:00Z"},
-            ],
-            "chat_005": [
-                {"id": "m9", "personType": "customer", "plainText": "도서 배송 언제 도착하나요? 이름은 김책사요.", "createdAt": "2024-08-04T09:31:00Z"},
-                {"id": "m10", "personType": "manager", "plainText": "금주 내 도착 예정입니다. 송장 보내드릴게요.", "createdAt": "2024-08-04T09:33:00Z"},
-            ],
-            "chat_006": [
-                {"id": "m11", "personType": "customer", "plainText": "도서가 파손되어 반품하고 싶어요.", "createdAt": "2024-08-04T10:05:00Z"},
-                {"id": "m12", "personType": "manager", "plainText": "불편을 드려 죄송합니다. 수거 접수해드리겠습니다.", "createdAt": "2024-08-04T10:06:00Z"},
-            ],
-            "chat_007": [
-                {"id": "m13", "personType": "customer", "plainText": "배송 주소를 서울 강남구 테헤란로123 5층으로 바꿀 수 있나요?", "createdAt": "2024-08-04T11:05:00Z"},
-                {"id": "m14", "personType": "manager", "plainText": "네 주소 변경 처리했습니다.", "createdAt": "2024-08-04T11:06:00Z"},
-            ],
-            "chat_008": [
-                {"id": "m15", "personType": "customer", "plainText": "정원규 한의학101 내용이 기대와 달라 환불하고 싶어요. 계좌는 987654321098", "createdAt": "2024-08-05T09:01:00Z"},
-                {"id": "m16", "personType": "manager", "plainText": "확인 후 환불 진행하겠습니다.", "createdAt": "2024-08-05T09:02:00Z"},
-            ],
-            "chat_009": [
-                {"id": "m17", "personType": "customer", "plainText": "정원규 한의학101 수강하려고 하는데 난이도가 어떤가요?", "createdAt": "2024-08-05T09:31:00Z"},
-                {"id": "m18", "personType": "manager", "plainText": "중급자 대상이며 예제 코드가 포함되어 있습니다.", "createdAt": "2024-08-05T09:32:00Z"},
-            ],
-            "chat_010": [
-                {"id": "m19", "personType": "customer", "plainText": "조유식 한국무용입문 환불 원합니다. 010-4444-5555로 연락주세요.", "createdAt": "2024-08-05T10:01:00Z"},
-                {"id": "m20", "personType": "manager", "plainText": "전화 없이 바로 환불 처리해드릴까요?", "createdAt": "2024-08-05T10:02:00Z"},
-            ],
-            "chat_011": [
-                {"id": "m21", "personType": "customer", "plainText": "조유식 한국무용입문 라이브 세션 일정이 어떻게 되나요?", "createdAt": "2024-08-05T10:31:00Z"},
-                {"id": "m22", "personType": "manager", "plainText": "매주 수요일 저녁 8시입니다.", "createdAt": "2024-08-05T10:32:00Z"},
-            ],
-            "chat_012": [
-                {"id": "m23", "personType": "customer", "plainText": "김현지 코스1 환불하고 싶어요. 서울 마포구 거주합니다.", "createdAt": "2024-08-05T11:01:00Z"},
-                {"id": "m24", "personType": "manager", "plainText": "확인 후 환불 도와드릴게요.", "createdAt": "2024-08-05T11:02:00Z"},
-            ],
-            "chat_013": [
-                {"id": "m25", "personType": "customer", "plainText": "김현지 코스2에 자막 제공되나요?", "createdAt": "2024-08-05T11:31:00Z"},
-                {"id": "m26", "personType": "manager", "plainText": "네, 자막과 스크립트가 제공됩니다.", "createdAt": "2024-08-05T11:32:00Z"},
-            ],
-            "chat_014": [
-                {"id": "m27", "personType": "customer", "plainText": "강의 스크립트가 있으면 복습이 더 편할 것 같아요.", "createdAt": "2024-08-06T08:05:00Z"},
-                {"id": "m28", "personType": "manager", "plainText": "좋은 제안 감사드립니다. 내부 검토하겠습니다.", "createdAt": "2024-08-06T08:06:00Z"},
-            ],
-            "chat_015": [
-                {"id": "m29", "personType": "customer", "plainText": "다크모드가 꼭 필요해요. 눈이 아파요.", "createdAt": "2024-08-06T09:05:00Z"},
-                {"id": "m30", "personType": "manager", "plainText": "피드백 감사합니다. 로드맵에 반영하겠습니다.", "createdAt": "2024-08-06T09:06:00Z"},
-            ],
-            "chat_016": [
-                {"id": "m31", "personType": "customer", "plainText": "모바일에서 버튼이 너무 작아요. 개선 요청합니다.", "createdAt": "2024-08-06T10:05:00Z"},
-                {"id": "m32", "personType": "manager", "plainText": "모바일 UI 개선 건으로 전달하겠습니다.", "createdAt": "2024-08-06T10:06:00Z"},
-            ],
-            "chat_017": [
-                {"id": "m33", "personType": "customer", "plainText": "주문한 강의 교재가 계속 안 와요. 송장도 없고 시간 오래 걸리네요.", "createdAt": "2024-08-06T12:05:00Z"},
-                {"id": "m34", "personType": "manager", "plainText": "지연 확인 후 송장/도착 예정일 안내드리겠습니다.", "createdAt": "2024-08-06T12:06:00Z"},
-            ],
-            "chat_018": [
-                {"id": "m35", "personType": "customer", "plainText": "책이 생각보다 별로라 반품하고 싶습니다. 주소는 경기 용인시 기흥구 보정동이에요.", "createdAt": "2024-08-06T13:05:00Z"},
-                {"id": "m36", "personType": "manager", "plainText": "수거 접수 도와드리겠습니다. 택배 기사 방문 일정 안내드릴게요.", "createdAt": "2024-08-06T13:06:00Z"},
-            ],
-            "chat_019": [
-                {"id": "m37", "personType": "customer", "plainText": "정원규 한의학101 내용이 기대 이하라서 환불할지 고민 중이에요. 010-7777-8888로 연락 주세요.", "createdAt": "2024-08-06T14:05:00Z"},
-                {"id": "m38", "personType": "manager", "plainText": "불편 드려 죄송합니다. 환불 또는 다른 코스 추천 중 어떤 걸 도와드릴까요?", "createdAt": "2024-08-06T14:06:00Z"},
-            ],
-            "chat_020": [
-                {"id": "m39", "personType": "customer", "plainText": "조유식 한국무용입문 듣고 있는데요, 분량이 생각보다 짧고 예제 코드 품질이 아쉽습니다. 환불까지는 아니지만 뭔가 보완이 되나요?", "createdAt": "2024-08-07T09:05:00Z"},
-                {"id": "m40", "personType": "manager", "plainText": "구체적으로 어떤 부분이 부족했는지 알려주시면 개선에 참고하겠습니다.", "createdAt": "2024-08-07T09:06:00Z"},
-                {"id": "m41", "personType": "customer", "plainText": "실습 파일이 너무 간단하고 챕터도 적어요. 추가 자료를 주시면 좋겠어요.", "createdAt": "2024-08-07T09:07:00Z"},
-                {"id": "m42", "personType": "manager", "plainText": "추가 실습 자료를 이번 주 내로 보내드리고, 필요 시 일부 환불도 가능하도록 검토하겠습니다.", "createdAt": "2024-08-07T09:08:00Z"},
-            ],
-            "chat_021": [
-                {"id": "m43", "personType": "customer", "plainText": "강의가 마음에 들긴 하는데 모바일에서 느리고, 환불할지 개선될 때까지 기다릴지 고민 중이에요.", "createdAt": "2024-08-07T10:05:00Z"},
-                {"id": "m44", "personType": "customer", "plainText": "다크모드와 오프라인 수강 기능이 있으면 환불 안 할 것 같아요. 지금은 불편해서요.", "createdAt": "2024-08-07T10:06:30Z"},
-                {"id": "m45", "personType": "manager", "plainText": "모바일 최적화와 다크모드는 로드맵에 있고, 오프라인 수강은 기술 검토 중입니다. 불편을 드려 죄송합니다.", "createdAt": "2024-08-07T10:08:00Z"},
-                {"id": "m46", "personType": "customer", "plainText": "혹시 환불 규정이 어떻게 되나요? 개선되면 다시 결제할 수도 있어요.", "createdAt": "2024-08-07T10:09:00Z"},
-            ],
-            "chat_022": [
-                {"id": "m47", "personType": "customer", "plainText": "도서와 강의 번들로 샀는데 책 배송이 늦고, 강의는 캡션이 없어서 이해가 어려워요.", "createdAt": "2024-08-07T11:05:00Z"},
-                {"id": "m48", "personType": "customer", "plainText": "반품보다는 캡션/스크립트랑 배송 일정만 확실하면 좋겠어요.", "createdAt": "2024-08-07T11:06:00Z"},
-                {"id": "m49", "personType": "manager", "plainText": "배송 일정 확인 후 공유드리고, 캡션/스크립트 제공 가능 여부도 확인하겠습니다.", "createdAt": "2024-08-07T11:07:00Z"},
-                {"id": "m50", "personType": "customer", "plainText": "필요하면 부분 환불도 가능한가요?", "createdAt": "2024-08-07T11:08:00Z"},
-            ],
-            "chat_023": [
-                {"id": "m51", "personType": "customer", "plainText": "이거 왜 이렇게 느려요 진짜 씨발 뭐 하는 거야? 환불이나 빨리 해줘.", "createdAt": "2024-08-07T12:05:00Z"},
-                {"id": "m52", "personType": "customer", "plainText": "상담원도 전화 안 받고 개나 소나 하는 건가요?", "createdAt": "2024-08-07T12:06:00Z"},
-                {"id": "m53", "personType": "manager", "plainText": "불편을 드려 죄송합니다. 환불 규정 안내드리고 빠르게 처리하겠습니다.", "createdAt": "2024-08-07T12:07:00Z"},
-            ],
-        }
-        messages = messages_map.get(
-            user_chat_id,
-            [{"id": "m0", "personType": "customer", "plainText": "안녕하세요", "createdAt": "2024-08-01T00:00:00Z"}],
-        )
+        messages = _MESSAGES_MAP.get(user_chat_id, _DEFAULT_MESSAGES)
         return {"messages": messages, "nextCursor": None}
 
+    def fetch_chats_bulk(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 대화의 메타데이터와 메시지를 한 번의 호출로 묶어 가져온다.
+
+        대화마다 메타/메시지를 따로 왕복하면 N개의 HTTP 요청이 필요하므로,
+        실제 연동 시에는 서버 측 배치 엔드포인트 하나로 줄인다.
+        목 구현은 단건 메서드를 돌며 같은 형태의 응답을 조립한다.
+        """
+        logger.debug("Mock fetch chats bulk for %d ids", len(ids))
+        # 실제 호출 예시 (메타+메시지를 단일 POST로 수신)
+        # url = f"{self.config.base_url}/open/v5/user-chats:batchGet"
+        # res = requests.post(url, headers=self._headers(), json={"ids": ids}, timeout=60)
+        # res.raise_for_status()
+        # return res.json()
+        return {
+            chat_id: {
+                "meta": self.fetch_chat_metadata(chat_id),
+                "messages": self.fetch_chat_messages(chat_id)["messages"],
+            }
+            for chat_id in ids
+        }
+
     def fetch_tags(self) -> Dict[str, Any]:
         logger.debug("Mock fetch tags")
         return {
@@ -253,3 +306,54 @@ class ChannelTalkClient:
                 {"id": "tag_bug", "name": "버그"},
             ]
         }
+
+
+class AsyncChannelTalkClient:
+    """대화 N건을 동시에 가져오는 비동기 클라이언트.
+
+    순차 왕복은 N·RTT가 걸리지만, 동시성 c로 팬아웃하면 ~RTT + N/c로 줄어든다
+    (이 경로는 CPU가 아니라 네트워크 지연이 병목).
+    실제 연동 시 keep-alive 연결 하나를 재사용하는 httpx.AsyncClient를 쓰고,
+    목 모드에서는 동기 클라이언트의 조회를 그대로 재사용합니다.
+    """
+
+    def __init__(self, config: ChannelTalkConfig, concurrency: int = 16):
+        self._sync = ChannelTalkClient(config)
+        self.concurrency = concurrency
+        # 실제 연동 예시 (연결 재사용 + 멀티플렉싱)
+        # import httpx
+        # self._client = httpx.AsyncClient(
+        #     base_url=config.base_url,
+        #     headers=self._sync._headers(),
+        #     http2=True,
+        #     limits=httpx.Limits(max_keepalive_connections=32),
+        # )
+
+    async def fetch_chat_bundle_async(self, user_chat_id: str) -> Dict[str, Any]:
+        # 실제 연동 예시 (메타/메시지 두 요청도 동시에)
+        # meta_res, msg_res = await asyncio.gather(
+        #     self._client.get(f"/open/v5/user-chats/{user_chat_id}"),
+        #     self._client.get(f"/open/v5/user-chats/{user_chat_id}/messages"),
+        # )
+        # return {"meta": meta_res.json(), "messages": msg_res.json()["messages"]}
+        return {
+            "meta": self._sync.fetch_chat_metadata(user_chat_id),
+            "messages": self._sync.fetch_chat_messages(user_chat_id)["messages"],
+        }
+
+    async def fetch_many(
+        self, ids: List[str], concurrency: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """id별 번들을 세마포어로 제한된 동시성으로 수집한다 (입력 순서 보존)."""
+        sem = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def bound(chat_id: str) -> Dict[str, Any]:
+            async with sem:
+                return await self.fetch_chat_bundle_async(chat_id)
+
+        results = await asyncio.gather(*(bound(chat_id) for chat_id in ids))
+        return dict(zip(ids, results))
+
+    def fetch_chats_bulk(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """동기 호출부용 심(shim): ChannelTalkClient.fetch_chats_bulk와 같은 형태."""
+        return asyncio.run(self.fetch_many(ids))
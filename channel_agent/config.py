@@ -1,4 +1,5 @@
 import os
+import re
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
@@ -7,14 +8,27 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# 환경변수는 import 시 한 번만 읽어 상수로 모아 둔다.
+# 어떤 설정이 환경에서 오는지 한눈에 보이고, 기본값 평가가 환경 조회 없이 끝난다.
+_CHANNELTALK_ACCESS_KEY = os.getenv("CHANNELTALK_ACCESS_KEY", "")
+_CHANNELTALK_ACCESS_SECRET = os.getenv("CHANNELTALK_ACCESS_SECRET", "")
+_CHANNELTALK_BASE_URL = os.getenv("CHANNELTALK_BASE_URL", "https://open.channel.io")
+_OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
+_OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4-1106-preview")
+_OPENAI_AGENT_NAME = os.getenv("OPENAI_AGENT_NAME", "ChannelTalkLabeler")
+_OPENAI_AGENT_DESCRIPTION = os.getenv(
+    "OPENAI_AGENT_DESCRIPTION", "채널톡 상담 데이터를 요약하고 라벨링합니다."
+)
+_CHANNEL_OUTPUT_DIR = os.getenv("CHANNEL_OUTPUT_DIR", "data/channel/results")
+
 
 @dataclass
 class ChannelTalkConfig:
     """Configuration for ChannelTalk API access."""
 
-    access_key: str = os.getenv("CHANNELTALK_ACCESS_KEY", "")
-    access_secret: str = os.getenv("CHANNELTALK_ACCESS_SECRET", "")
-    base_url: str = os.getenv("CHANNELTALK_BASE_URL", "https://open.channel.io")
+    access_key: str = _CHANNELTALK_ACCESS_KEY
+    access_secret: str = _CHANNELTALK_ACCESS_SECRET
+    base_url: str = _CHANNELTALK_BASE_URL
 
     def validate(self) -> None:
         if not self.access_key or not self.access_secret:
@@ -27,12 +41,10 @@ class ChannelTalkConfig:
 class OpenAIConfig:
     """Configuration for the OpenAI Agent."""
 
-    api_key: str = os.getenv("OPENAI_API_KEY", "")
-    model: str = os.getenv("OPENAI_MODEL", "gpt-4-1106-preview")
-    agent_name: str = os.getenv("OPENAI_AGENT_NAME", "ChannelTalkLabeler")
-    description: str = os.getenv(
-        "OPENAI_AGENT_DESCRIPTION", "채널톡 상담 데이터를 요약하고 라벨링합니다."
-    )
+    api_key: str = _OPENAI_API_KEY
+    model: str = _OPENAI_MODEL
+    agent_name: str = _OPENAI_AGENT_NAME
+    description: str = _OPENAI_AGENT_DESCRIPTION
 
     def validate(self) -> None:
         if not self.api_key:
@@ -44,7 +56,7 @@ class PipelineConfig:
     """Runtime knobs for the labeling pipeline."""
 
     message_page_size: int = 100
-    output_dir: str = os.getenv("CHANNEL_OUTPUT_DIR", "data/channel/results")
+    output_dir: str = _CHANNEL_OUTPUT_DIR
     output_file: str = "labeled_chats.csv"
     agent_instructions: Optional[str] = None
     disable_local_mask: bool = False
@@ -84,3 +96,12 @@ class PipelineConfig:
     )
     abuse_threshold: int = 2  # 욕설 카운트가 이 값 이상이고 서비스 키워드가 없으면 드롭
     skipped_output_file: str = "skipped_chats.csv"
+
+    def __post_init__(self) -> None:
+        # 키워드마다 'kw in text'로 K번 스캔하는 대신, 한 번 컴파일한 얼터네이션으로
+        # 대화 텍스트를 단일 패스 검사한다
+        self._service_kw_re = re.compile("|".join(map(re.escape, self.service_keywords)))
+
+    def contains_service_kw(self, text: str) -> bool:
+        """서비스 관련 키워드가 하나라도 포함되어 있으면 True."""
+        return self._service_kw_re.search(text) is not None
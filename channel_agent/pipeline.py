@@ -43,30 +43,21 @@ class ChannelLabelingPipeline:
         self.agent = agent
         self.config = config or PipelineConfig()
 
-    def _collect_messages(self, chat_id: str) -> List[Dict[str, Any]]:
-        cursor: Optional[str] = None
-        messages: List[Dict[str, Any]] = []
-        while True:
-            payload = self.channel_client.fetch_chat_messages(
-                chat_id, limit=self.config.message_page_size, cursor=cursor
-            )
-            chunk = payload.get("messages", [])
-            messages.extend(chunk)
-            cursor = payload.get("nextCursor") or payload.get("next") or payload.get("cursor")
-            has_more = (
-                payload.get("hasMore")
-                or payload.get("has_next")
-                or bool(cursor)
+    def _fetch_chat_bundles(self, chat_ids: List[str]) -> List[ChatBundle]:
+        # 대화별 메타/메시지 왕복(2N회) 대신 배치 API 한 번으로 모아 온다
+        bulk = self.channel_client.fetch_chats_bulk(chat_ids)
+        bundles: List[ChatBundle] = []
+        for chat_id in chat_ids:
+            entry = bulk.get(chat_id) or {}
+            bundles.append(
+                ChatBundle(
+                    user_chat_id=chat_id,
+                    metadata=entry.get("meta") or {},
+                    messages=entry.get("messages") or [],
+                )
             )
-            if not has_more or not chunk:
-                break
-        logger.debug("Fetched %d messages for %s", len(messages), chat_id)
-        return messages
-
-    def _fetch_chat_bundle(self, user_chat_id: str) -> ChatBundle:
-        metadata = self.channel_client.fetch_chat_metadata(user_chat_id)
-        messages = self._collect_messages(user_chat_id)
-        return ChatBundle(user_chat_id=user_chat_id, metadata=metadata, messages=messages)
+        logger.debug("Fetched %d chat bundles in one bulk call", len(bundles))
+        return bundles
 
     def _merge_dialog_text(self, messages: List[Dict[str, Any]]) -> str:
         def message_key(msg: Dict[str, Any]) -> Any:
@@ -93,8 +84,10 @@ class ChannelLabelingPipeline:
     def _is_off_topic(self, dialog_text: str) -> bool:
         """Return True if dialog is abusive/off-topic (no service keywords but high profanity)."""
         profanity_count = count_profanity(dialog_text)
-        has_service_kw = any(kw in dialog_text for kw in self.config.service_keywords)
-        return profanity_count >= self.config.abuse_threshold and not has_service_kw
+        if profanity_count < self.config.abuse_threshold:
+            # 욕설이 기준 미만이면 키워드 스캔 자체를 건너뛴다
+            return False
+        return not self.config.contains_service_kw(dialog_text)
 
     def run(self, created_from: str, created_to: str) -> str:
         """Run the pipeline for a date range and return the output CSV path."""
@@ -104,8 +97,8 @@ class ChannelLabelingPipeline:
         labeled_rows: List[LabeledChat] = []
         skipped_rows: List[SkippedChat] = []
         flat_labels: List[FlatLabel] = []
-        for chat_id in chat_ids:
-            bundle = self._fetch_chat_bundle(chat_id)
+        for bundle in self._fetch_chat_bundles(chat_ids):
+            chat_id = bundle.user_chat_id
             dialog_text = self._merge_dialog_text(bundle.messages)
             if self._is_off_topic(dialog_text):
                 logger.info("Skipping off-topic/abusive chat_id=%s", chat_id)
@@ -8,21 +8,35 @@ Features:
 - Search performs cosine similarity over stored vectors.
 """
 
+import hashlib
 import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 import numpy as np
 
 try:
-    from openai import OpenAI
+    from openai import APIConnectionError, APITimeoutError, OpenAI, RateLimitError
+
+    _TRANSIENT_API_ERRORS: Tuple[type, ...] = (RateLimitError, APITimeoutError, APIConnectionError)
 except Exception:  # pragma: no cover - openai not installed
     OpenAI = None  # type: ignore
+    _TRANSIENT_API_ERRORS = ()
 
 SAMPLES_DIR = "data/channel/samples"
 SAMPLES_FILE = os.path.join(SAMPLES_DIR, "samples.csv")
 VECTORS_FILE = os.path.join(SAMPLES_DIR, "sample_vectors.json")
+EMBED_CACHE_FILE = os.path.join(SAMPLES_DIR, "embedding_cache.json")
+
+# OpenAI 임베딩 요청당 입력 수 / 동시 요청 수 / 일시 오류 재시도 상한
+# 임베딩 호출은 I/O 바운드이므로 코어 수보다 넉넉하게 잡고, 환경변수로 조정 가능
+EMBED_BATCH_SIZE = 512
+EMBED_MAX_CONCURRENCY = int(os.getenv("EMBED_MAX_CONCURRENCY", str((os.cpu_count() or 4) * 5)))
+EMBED_MAX_TRIES = 3
 
 
 @dataclass
@@ -49,12 +63,113 @@ def _hash_embed(text: str, dim: int = 384) -> np.ndarray:
     return vec if norm == 0 else vec / norm
 
 
+@lru_cache(maxsize=None)
+def _openai_client() -> "OpenAI":
+    """Shared OpenAI client so repeat embed calls reuse one connection pool."""
+    if OpenAI is None:
+        raise RuntimeError("openai package is not installed")
+    return OpenAI()
+
+
+def _embed_cache_key(model: str, text: str) -> str:
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{model}:{digest}"
+
+
+def _load_embed_cache() -> dict:
+    if not os.path.exists(EMBED_CACHE_FILE):
+        return {}
+    try:
+        with open(EMBED_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):  # 손상된 캐시는 무시하고 새로 채움
+        return {}
+
+
+def _save_embed_cache(cache: dict) -> None:
+    # 임시 파일에 쓰고 교체해 동시 실행/중단 시에도 캐시가 깨지지 않게 한다
+    _ensure_dir(EMBED_CACHE_FILE)
+    tmp_path = f"{EMBED_CACHE_FILE}.tmp.{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, EMBED_CACHE_FILE)
+
+
+def _retry_delay(exc: Exception, attempt: int) -> float:
+    """서버가 Retry-After를 주면 그 값을, 없으면 지수 백오프를 따른다."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is not None:
+        retry_after = headers.get("retry-after")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+    return float(2**attempt)
+
+
+def _request_embeddings(texts: List[str], model: str) -> List[np.ndarray]:
+    client = _openai_client()
+
+    def embed_chunk(chunk: List[str]) -> List[np.ndarray]:
+        # 레이트리밋/타임아웃/접속 오류만 재시도; 4xx 등 영구 오류는 즉시 전파
+        for attempt in range(EMBED_MAX_TRIES):
+            try:
+                resp = client.embeddings.create(model=model, input=chunk)
+            except _TRANSIENT_API_ERRORS as exc:
+                if attempt == EMBED_MAX_TRIES - 1:
+                    raise
+                time.sleep(_retry_delay(exc, attempt))
+            else:
+                return [np.array(item.embedding, dtype=float) for item in resp.data]
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    chunks = [texts[start : start + EMBED_BATCH_SIZE] for start in range(0, len(texts), EMBED_BATCH_SIZE)]
+    if len(chunks) == 1:
+        return embed_chunk(chunks[0])
+
+    # 네트워크 병목이므로 청크를 동시에 전송 (map이 입력 순서를 보존)
+    embeddings: List[np.ndarray] = []
+    with ThreadPoolExecutor(max_workers=min(EMBED_MAX_CONCURRENCY, len(chunks))) as pool:
+        for chunk_embeddings in pool.map(embed_chunk, chunks):
+            embeddings.extend(chunk_embeddings)
+    return embeddings
+
+
 def _openai_embed(texts: List[str], model: str = "text-embedding-3-small") -> List[np.ndarray]:
     if OpenAI is None:
         raise RuntimeError("openai package is not installed")
-    client = OpenAI()
-    resp = client.embeddings.create(model=model, input=texts)
-    return [np.array(item.embedding, dtype=float) for item in resp.data]
+    if not texts:
+        return []
+
+    # 같은 텍스트를 재실행에서 다시 임베딩하지 않도록 디스크 캐시를 먼저 조회
+    cache = _load_embed_cache()
+    keys = [_embed_cache_key(model, text) for text in texts]
+    embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
+    miss_indices: List[int] = []
+    for idx, key in enumerate(keys):
+        cached = cache.get(key)
+        if cached is not None:
+            embeddings[idx] = np.array(cached, dtype=float)
+        else:
+            miss_indices.append(idx)
+
+    if miss_indices:
+        # 중복 텍스트는 한 번만 요청하고 결과를 각 위치로 되돌린다
+        fetch_positions: dict = {}
+        fetch_texts: List[str] = []
+        for idx in miss_indices:
+            if keys[idx] not in fetch_positions:
+                fetch_positions[keys[idx]] = len(fetch_texts)
+                fetch_texts.append(texts[idx])
+        fetched = _request_embeddings(fetch_texts, model)
+        for idx in miss_indices:
+            vector = fetched[fetch_positions[keys[idx]]]
+            embeddings[idx] = vector
+            cache[keys[idx]] = vector.tolist()
+        _save_embed_cache(cache)
+
+    return embeddings  # type: ignore[return-value]
 
 
 def build_sample_index(use_mock_embeddings: bool = True, model: str = "text-embedding-3-small") -> str:
@@ -67,22 +182,24 @@ def build_sample_index(use_mock_embeddings: bool = True, model: str = "text-embe
     if "text" not in df.columns:
         raise ValueError("샘플 파일에 'text' 컬럼이 없습니다.")
 
-    records: List[SampleVector] = []
-
-    texts = [str(t) for t in df["text"].tolist()]
+    # 행 단위 str() 변환/분할 대신 컬럼 전체를 C 경로에서 처리한다
+    texts = df["text"].astype(str).tolist()
     if len(texts) == 0:
         raise ValueError("샘플 데이터가 비어 있습니다. 입력 후 다시 시도하세요.")
 
-    labels_series = df["labels"].fillna("")
-    labels_list = [[p for p in str(l).split("|") if p] for l in labels_series]
+    # 결측 라벨이 astype(str)로 "nan"/"None" 문자열이 되지 않도록 먼저 빈 문자열로 채운다
+    labels_split = df["labels"].fillna("").astype(str).str.split("|")
+    labels_list = [[p for p in parts if p] for parts in labels_split]
 
     if use_mock_embeddings:
         embeds = [_hash_embed(t) for t in texts]
     else:
         embeds = _openai_embed(texts, model=model)
 
-    for text, labs, emb in zip(texts, labels_list, embeds):
-        records.append(SampleVector(text=text, labels=labs, vector=emb.tolist()))
+    records = [
+        SampleVector(text=text, labels=labs, vector=emb.tolist())
+        for text, labs, emb in zip(texts, labels_list, embeds)
+    ]
 
     _ensure_dir(VECTORS_FILE)
     with open(VECTORS_FILE, "w", encoding="utf-8") as f:
@@ -6,6 +6,7 @@ Features:
 - SQL 탭: DuckDB 메모리 쿼리
 - 자연어 집계(룰 기반): 기간/강사 환불 비율 집계
 """
+import hashlib
 import os
 import re
 import sys
@@ -23,16 +24,21 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
-from channel_agent.agent import ChannelAgent
-from channel_agent.channel_api import ChannelTalkClient
-from channel_agent.config import ChannelTalkConfig, OpenAIConfig, PipelineConfig
-from channel_agent.pipeline import ChannelLabelingPipeline
 from channel_agent.sample_vectors import build_sample_index, search_sample_index
 
 SAMPLES_DIR = "data/channel/samples"
 SAMPLES_FILE = os.path.join(SAMPLES_DIR, "samples.csv")
 RESULTS_DIR = "data/channel/results"
 RESULT_FILE = "ui_labeled_chats.csv"
+SAMPLE_COLUMNS = frozenset({"text", "labels"})
+
+
+def _read_csv_fast(path, **kwargs) -> pd.DataFrame:
+    """pyarrow 멀티스레드 파서를 우선 쓰고, 미지원 옵션/미설치면 기본 엔진으로 돌아간다."""
+    try:
+        return pd.read_csv(path, engine="pyarrow", **kwargs)
+    except (ImportError, ValueError, TypeError):
+        return pd.read_csv(path, **kwargs)
 
 
 def normalize_labels(label_str: str) -> str:
@@ -42,19 +48,60 @@ def normalize_labels(label_str: str) -> str:
     return "|".join(parts)
 
 
+def _upload_fingerprint(name: str, data: bytes) -> str:
+    """업로드 파일 식별자. 전체 바이트 대신 머리/꼬리 64KiB와 크기만 해시한다."""
+    digest = hashlib.blake2b(data[:65536], digest_size=16)
+    if len(data) > 65536:
+        digest.update(data[-65536:])
+    return f"{name}:{len(data)}:{digest.hexdigest()}"
+
+
+@st.cache_data(show_spinner=False)
+def _parse_uploaded_samples(fingerprint: str, _file_bytes: bytes, name: str) -> pd.DataFrame:
+    """업로드 파일 파싱 결과를 fingerprint 키로 캐시해 위젯 조작마다 재파싱하지 않는다.
+
+    _file_bytes는 언더스코어 인자라 캐시 키에서 제외된다 — 대용량 파일 전체를
+    rerun마다 다시 해시하지 않기 위함이다.
+    """
+    buffer = BytesIO(_file_bytes)
+    if name.lower().endswith(".csv"):
+        uploaded_df = pd.read_csv(buffer)
+    else:
+        try:
+            # calamine(러스트 기반)은 전체 워크북 모델을 만들지 않고 스트리밍 파싱한다
+            uploaded_df = pd.read_excel(buffer, engine="calamine")
+        except (ImportError, ValueError):
+            buffer.seek(0)
+            uploaded_df = pd.read_excel(buffer)
+    lowered = {col: str(col).lower() for col in uploaded_df.columns}
+    uploaded_df = uploaded_df[[col for col, low in lowered.items() if low in SAMPLE_COLUMNS]].rename(columns=lowered)
+    uploaded_df["labels"] = uploaded_df["labels"].apply(normalize_labels)
+    return uploaded_df
+
+
+@st.cache_data(show_spinner=False)
+def _load_samples_csv(path: str, mtime: float) -> pd.DataFrame:
+    """저장된 샘플 CSV를 (경로, 수정시각) 키로 캐시해 rerun마다 디스크를 읽지 않는다."""
+    return _read_csv_fast(path)
+
+
+@st.fragment
 def samples_tab():
     st.markdown("### 샘플 관리 (text, labels)")
     st.markdown("- CSV/엑셀 업로드 시 컬럼명을 text, labels 로 맞춰주세요. 라벨은 , 또는 | 로 구분됩니다.")
 
-    existing_df = pd.read_csv(SAMPLES_FILE) if os.path.exists(SAMPLES_FILE) else pd.DataFrame(columns=["text", "labels"])
+    if os.path.exists(SAMPLES_FILE):
+        existing_df = _load_samples_csv(SAMPLES_FILE, os.path.getmtime(SAMPLES_FILE))
+    else:
+        existing_df = pd.DataFrame(columns=["text", "labels"])
 
     uploaded_file = st.file_uploader("샘플 CSV/엑셀 업로드 (선택)", type=["csv", "xlsx"], key="upload_samples")
     uploaded_df = None
     if uploaded_file:
-        uploaded_df = pd.read_csv(uploaded_file) if uploaded_file.name.lower().endswith(".csv") else pd.read_excel(uploaded_file)
-        uploaded_df = uploaded_df.rename(columns=str.lower)
-        uploaded_df = uploaded_df[[c for c in uploaded_df.columns if c in ["text", "labels"]]]
-        uploaded_df["labels"] = uploaded_df["labels"].apply(normalize_labels)
+        file_bytes = uploaded_file.getvalue()
+        uploaded_df = _parse_uploaded_samples(
+            _upload_fingerprint(uploaded_file.name, file_bytes), file_bytes, uploaded_file.name
+        )
         st.success(f"업로드 {len(uploaded_df)}건 로드 완료")
 
     combined_df = existing_df if uploaded_df is None else pd.concat([existing_df, uploaded_df], ignore_index=True)
@@ -99,6 +146,12 @@ def samples_tab():
 def run_pipeline(mock_mode: bool, created_from: str, created_to: str,
                  disable_local_mask: bool, use_sample_index: bool,
                  sample_use_mock_embed: bool, sample_top_k: int) -> str:
+    # openai 등 무거운 의존성은 실행 버튼을 눌렀을 때만 로드한다 (앱 기동/rerun 비용 절감)
+    from channel_agent.agent import ChannelAgent
+    from channel_agent.channel_api import ChannelTalkClient
+    from channel_agent.config import ChannelTalkConfig, OpenAIConfig, PipelineConfig
+    from channel_agent.pipeline import ChannelLabelingPipeline
+
     agent = MockAgent() if mock_mode else ChannelAgent(OpenAIConfig(), ChannelTalkClient(ChannelTalkConfig()))
     channel_client = ChannelTalkClient(ChannelTalkConfig(access_key="mock", access_secret="mock")) if mock_mode else ChannelTalkClient(ChannelTalkConfig())
     pipeline = ChannelLabelingPipeline(
@@ -132,6 +185,7 @@ class MockAgent:
         return {"summary": dialog_text[:100], "labels": labels[:2], "emotion": "neutral"}
 
 
+@st.fragment
 def pipeline_tab():
     st.markdown("### 채널톡 라벨링 실행")
     today = date.today()
@@ -159,7 +213,7 @@ def pipeline_tab():
                 output_path = run_pipeline(mock_mode, created_from, created_to, disable_local_mask,
                                            use_sample_index, sample_use_mock_embed, sample_top_k)
                 if os.path.exists(output_path):
-                    df = pd.read_csv(output_path)
+                    df = _read_csv_fast(output_path)
                     st.session_state["results_df"] = df
                     st.session_state["results_output_path"] = output_path
                     st.success(f"완료: {output_path}")
@@ -177,26 +231,25 @@ def pipeline_tab():
             st.dataframe(df, use_container_width=True)
             st.download_button("CSV 다운로드", data=df.to_csv(index=False), file_name=os.path.basename(output_path), mime="text/csv")
             col_a, col_b = st.columns(2)
+            # 미리보기는 앞 200행만 파싱하고, 다운로드는 재직렬화 대신 원본 바이트를 그대로 쓴다
             if labels_path and labels_path.exists():
                 with col_a:
                     st.markdown("**chat_labels.csv**")
-                    df_labels = pd.read_csv(labels_path)
-                    st.dataframe(df_labels.head(200), use_container_width=True)
-                    st.download_button("chat_labels.csv 다운로드", data=df_labels.to_csv(index=False), file_name=labels_path.name, mime="text/csv")
+                    st.dataframe(pd.read_csv(labels_path, nrows=200), use_container_width=True)
+                    st.download_button("chat_labels.csv 다운로드", data=labels_path.read_bytes(), file_name=labels_path.name, mime="text/csv")
             if skipped_path and skipped_path.exists():
                 with col_b:
                     st.markdown("**skipped_chats.csv**")
-                    df_skipped = pd.read_csv(skipped_path)
-                    st.dataframe(df_skipped.head(200), use_container_width=True)
-                    st.download_button("skipped_chats.csv 다운로드", data=df_skipped.to_csv(index=False), file_name=skipped_path.name, mime="text/csv")
+                    st.dataframe(pd.read_csv(skipped_path, nrows=200), use_container_width=True)
+                    st.download_button("skipped_chats.csv 다운로드", data=skipped_path.read_bytes(), file_name=skipped_path.name, mime="text/csv")
             # 통합 엑셀
             if labels_path and labels_path.exists():
                 excel_buffer = BytesIO()
                 with pd.ExcelWriter(excel_buffer, engine="xlsxwriter") as writer:
                     df.to_excel(writer, sheet_name="labeled_chats", index=False)
-                    df_labels.to_excel(writer, sheet_name="chat_labels", index=False)
+                    _read_csv_fast(labels_path).to_excel(writer, sheet_name="chat_labels", index=False)
                     if skipped_path and skipped_path.exists():
-                        df_skipped.to_excel(writer, sheet_name="skipped_chats", index=False)
+                        _read_csv_fast(skipped_path).to_excel(writer, sheet_name="skipped_chats", index=False)
                 excel_buffer.seek(0)
                 st.download_button("통합 엑셀 다운로드", data=excel_buffer.read(), file_name="channel_labeling_results.xlsx",
                                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
@@ -224,7 +277,7 @@ def pipeline_tab():
             if labels_path and labels_path.exists():
                 import duckdb
                 con = duckdb.connect(database=":memory:")
-                df_labels = pd.read_csv(labels_path).rename(columns={"user_chat_id": "chat_id"})
+                df_labels = _read_csv_fast(labels_path).rename(columns={"user_chat_id": "chat_id"})
                 df_chats_q = df.rename(columns={"user_chat_id": "chat_id"})
                 con.register("chat_labels", df_labels)
                 con.register("chats", df_chats_q)
@@ -278,7 +331,7 @@ SELECT
 
                 import duckdb
                 con = duckdb.connect(database=":memory:")
-                df_labels = pd.read_csv(labels_path).rename(columns={"user_chat_id": "chat_id"})
+                df_labels = _read_csv_fast(labels_path).rename(columns={"user_chat_id": "chat_id"})
                 df_chats_q = df.rename(columns={"user_chat_id": "chat_id"})
                 con.register("chat_labels", df_labels)
                 con.register("chats", df_chats_q)
@@ -71,7 +71,7 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
         return yaml.safe_load(handle) or {}
 
 
-@lru_cache(maxsize=1)
+@lru_cache(maxsize=None)
 def get_settings(path: Optional[Path] = None) -> Settings:
     """Load and cache application settings."""
 
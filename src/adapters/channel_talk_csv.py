@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Iterable, List, Optional
 
 import pandas as pd
@@ -23,20 +26,29 @@ class ChannelTalkCSVAdapter:
     """Normalizes ChannelTalk CSV/Excel exports into Conversation objects."""
 
     dataframes: Dict[str, pd.DataFrame]
+    _frames_by_alias: Dict[str, pd.DataFrame] = field(default_factory=dict, init=False, repr=False)
 
     def conversations(self) -> Iterable[Conversation]:
         userchat_df = self._get_dataframe("UserChat")
         message_df = self._get_dataframe("Message")
 
-        users = self._prepare_users()
-        managers = self._prepare_managers()
-        bots = self._prepare_bots()
-        workflows = self._prepare_workflows()
-        tags = self._prepare_tags()
+        # 각 준비 단계는 서로 다른 시트만 읽으므로 동시에 실행한다.
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            users_future = executor.submit(self._prepare_users)
+            managers_future = executor.submit(self._prepare_managers)
+            bots_future = executor.submit(self._prepare_bots)
+            workflows_future = executor.submit(self._prepare_workflows)
+            tags_future = executor.submit(self._prepare_tags)
+            messages_future = executor.submit(self._group_messages, message_df)
 
-        messages_grouped = self._group_messages(message_df)
+        users = users_future.result()
+        managers = managers_future.result()
+        bots = bots_future.result()
+        workflows = workflows_future.result()
+        tags = tags_future.result()
+        messages_grouped = messages_future.result()
 
-        for _, row in userchat_df.iterrows():
+        for row in userchat_df.to_dict(orient="records"):
             conv_id = str(row["id"])
 
             convo_messages = messages_grouped.get(conv_id, [])
@@ -81,30 +93,62 @@ class ChannelTalkCSVAdapter:
         if message_df.empty:
             return grouped
 
-        for _, row in message_df.iterrows():
-            chat_id = str(row.get("chatId"))
+        chat_ids = self._column_as_str(message_df, "chatId")
+        if "messageId" in message_df.columns:
+            message_ids = self._column_as_str(message_df, "messageId")
+        else:
+            message_ids = self._column_as_str(message_df, "id")
+        if "personType" in message_df.columns:
+            sender_types = message_df["personType"].astype(str).str.lower()
+        else:
+            sender_types = pd.Series("system", index=message_df.index)
+        texts = self._column_as_str(message_df, "plainText")
+        sender_ids = self._column_values(message_df, "personId")
+        created_values = self._column_values(message_df, "createdAt")
+
+        parsed_times = pd.to_datetime(created_values, errors="coerce")
+        order = parsed_times.to_numpy().argsort(kind="stable")
+        fallback_time = datetime.utcnow()
+
+        chat_id_list = chat_ids.to_list()
+        message_id_list = message_ids.to_list()
+        sender_type_list = sender_types.to_list()
+        sender_id_list = sender_ids.to_list()
+        text_list = texts.to_list()
+        time_list = parsed_times.to_list()
+
+        for position in order:
+            parsed_time = time_list[position]
+            sender_id = sender_id_list[position]
+            chat_id = chat_id_list[position]
             message = Message(
-                id=str(row.get("messageId", row.get("id", ""))),
+                id=message_id_list[position],
                 conversation_id=chat_id,
-                sender_type=str(row.get("personType", "system")).lower(),
-                sender_id=str(row.get("personId")) if row.get("personId") else None,
-                created_at=self._parse_datetime(row.get("createdAt")) or datetime.utcnow(),
-                text=str(row.get("plainText", "")),
+                sender_type=sender_type_list[position],
+                sender_id=str(sender_id) if sender_id else None,
+                created_at=parsed_time.to_pydatetime() if pd.notna(parsed_time) else fallback_time,
+                text=text_list[position],
             )
             grouped.setdefault(chat_id, []).append(message)
 
-        for chat_id in grouped:
-            grouped[chat_id].sort(key=lambda msg: msg.created_at)
         return grouped
 
-    def _prepare_users(self) -> Dict[str, UserProfile]:
-        df = self._get_dataframe("User")
-        if df.empty:
-            return {}
+    @staticmethod
+    def _column_as_str(df: pd.DataFrame, name: str) -> pd.Series:
+        """Return a column converted to strings in one vectorized pass."""
+        if name in df.columns:
+            return df[name].astype(str)
+        return pd.Series("", index=df.index)
 
+    @staticmethod
+    def _column_values(df: pd.DataFrame, name: str) -> pd.Series:
+        if name in df.columns:
+            return df[name]
+        return pd.Series(None, index=df.index, dtype=object)
+
+    def _prepare_users(self) -> Dict[str, UserProfile]:
         users: Dict[str, UserProfile] = {}
-        for _, row in df.iterrows():
-            user_id = str(row["id"])
+        for user_id, row in self._rows_by_id(self._get_dataframe("User")).items():
             users[user_id] = UserProfile(
                 id=user_id,
                 name=row.get("profile.name"),
@@ -120,13 +164,8 @@ class ChannelTalkCSVAdapter:
         return users
 
     def _prepare_managers(self) -> Dict[str, ManagerProfile]:
-        df = self._get_dataframe("Manager")
         managers: Dict[str, ManagerProfile] = {}
-        if df.empty:
-            return managers
-
-        for _, row in df.iterrows():
-            manager_id = str(row.get("id"))
+        for manager_id, row in self._rows_by_id(self._get_dataframe("Manager")).items():
             managers[manager_id] = ManagerProfile(
                 id=manager_id,
                 name=row.get("name"),
@@ -136,12 +175,8 @@ class ChannelTalkCSVAdapter:
         return managers
 
     def _prepare_bots(self) -> Dict[str, BotProfile]:
-        df = self._get_dataframe("Bot")
         bots: Dict[str, BotProfile] = {}
-        if df.empty:
-            return bots
-        for _, row in df.iterrows():
-            bot_id = str(row.get("id"))
+        for bot_id, row in self._rows_by_id(self._get_dataframe("Bot")).items():
             bots[bot_id] = BotProfile(
                 id=bot_id,
                 name=row.get("name"),
@@ -150,12 +185,8 @@ class ChannelTalkCSVAdapter:
         return bots
 
     def _prepare_workflows(self) -> Dict[str, Dict[str, str]]:
-        df = self._get_dataframe("Workflow")
         workflows: Dict[str, Dict[str, str]] = {}
-        if df.empty:
-            return workflows
-        for _, row in df.iterrows():
-            workflow_id = str(row.get("id"))
+        for workflow_id, row in self._rows_by_id(self._get_dataframe("Workflow")).items():
             workflows[workflow_id] = {
                 "revisionId": row.get("revisionId"),
                 "sectionPath": row.get("sectionPath"),
@@ -163,22 +194,28 @@ class ChannelTalkCSVAdapter:
             }
         return workflows
 
+    @staticmethod
+    def _rows_by_id(df: pd.DataFrame) -> Dict[str, Dict[str, object]]:
+        """Index a sheet by id and expand it into row dicts in one C pass."""
+        if df.empty or "id" not in df.columns:
+            return {}
+        indexed = df.drop_duplicates(subset="id", keep="last").set_index("id")
+        return {str(key): row for key, row in indexed.to_dict(orient="index").items()}
+
     def _prepare_tags(self) -> Dict[str, str]:
         df = self._get_dataframe("UserChatTag")
-        tags: Dict[str, str] = {}
-        if df.empty:
-            return tags
-        for _, row in df.iterrows():
-            tag_name = str(row.get("name"))
-            tags[tag_name] = tag_name
-        return tags
+        if df.empty or "name" not in df.columns:
+            return {}
+        names = df["name"].astype(str).drop_duplicates()
+        return dict(zip(names, names))
 
     def _get_dataframe(self, name: str) -> pd.DataFrame:
-        target = self._normalize(name)
-        for key, df in self.dataframes.items():
-            if self._normalize(key) == target:
-                return df
-        return pd.DataFrame()
+        if not self._frames_by_alias:
+            for key, df in self.dataframes.items():
+                self._frames_by_alias.setdefault(_normalize(key), df)
+        target = _normalize(name)
+        frame = self._frames_by_alias.get(target)
+        return frame if frame is not None else pd.DataFrame()
 
     def _split_ids(self, value: Optional[object], separator: str = ",") -> List[str]:
         if value is None:
@@ -207,6 +244,15 @@ class ChannelTalkCSVAdapter:
             return parsed
         return None
 
-    @staticmethod
-    def _normalize(name: str) -> str:
-        return "".join(ch for ch in name.lower() if ch.isalnum())
+
+# 시트 이름 정규화용 패턴은 모듈 로드 시 한 번만 컴파일한다.
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_SHEET_SUFFIX = re.compile(r"(?:data|dat)$")
+
+
+@lru_cache(maxsize=None)
+def _normalize(name: str) -> str:
+    """Normalize a sheet name, ignoring case/punctuation and a 'data' suffix."""
+    normalized = _NON_ALNUM.sub("", name.lower())
+    stripped = _SHEET_SUFFIX.sub("", normalized)
+    return stripped or normalized
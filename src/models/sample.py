@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Any, Dict, Iterable, List, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SampleRecord:
     """Single human-labeled sample stored in the library."""
 
@@ -61,7 +61,7 @@ class SampleRecord:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SampleMatch:
     """Result item returned by the similarity retriever."""
 
@@ -74,7 +74,7 @@ class SampleMatch:
     meta: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SampleLibrary:
     """Collection of sample records keyed by id."""
 
@@ -4,9 +4,18 @@ from __future__ import annotations
 
 import logging
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import repeat
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Protocol, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Sequence
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson 미설치 환경
+    _json_loads = json.loads
 
 from src.models.conversation import Conversation
 from src.models.label import LabelRecord, LabelResult, SampleReference
@@ -28,9 +37,11 @@ class LabelingPipeline:
         self,
         retriever: SimilarityRetriever,
         llm_service: Optional["LLMService"] = None,
+        max_workers: int = 8,
     ) -> None:
         self.retriever = retriever
         self.llm_service = llm_service
+        self.max_workers = max_workers
 
     def run(
         self,
@@ -42,31 +53,93 @@ class LabelingPipeline:
         failed: List[str] = []
         errors: Dict[str, str] = {}
 
-        for convo in conversations:
-            matches = self.retriever.retrieve(convo, library) if library else []
-
-            if self.llm_service is not None:
-                try:
-                    result = self.llm_service.label(convo, matches, label_schema)
-                except Exception as exc:  # pragma: no cover - fallback path
-                    logger.exception("Labeling failed for %s", convo.id)
-                    result = self._fallback_label(matches)
-                    failed.append(convo.id)
-                    errors[convo.id] = str(exc)
-            else:
-                result = self._fallback_label(matches)
-
-            records.append(
-                LabelRecord(
-                    conversation_id=convo.id,
-                    conversation_version=None,
-                    result=result,
-                    created_at=datetime.utcnow(),
-                )
-            )
+        for record, error in self._iter_labeled(conversations, library, label_schema):
+            if error is not None:
+                failed.append(record.conversation_id)
+                errors[record.conversation_id] = error
+            records.append(record)
 
         return LabelingResult(records=records, failed=failed, errors=errors)
 
+    def iter_records(
+        self,
+        conversations: Sequence[Conversation],
+        library: Optional[SampleLibrary],
+        label_schema: Optional[Sequence[str]] = None,
+    ) -> Iterator[LabelRecord]:
+        """전체 결과를 메모리에 쌓지 않고 완료되는 순서대로(입력 순) 내보낸다.
+
+        대량 배치를 jsonl 등으로 바로 흘려 쓸 때 사용한다. 실패한 대화도
+        fallback 라벨로 포함되며, 오류 상세가 필요하면 run()을 사용한다.
+        """
+        for record, _ in self._iter_labeled(conversations, library, label_schema):
+            yield record
+
+    def _iter_labeled(
+        self,
+        conversations: Sequence[Conversation],
+        library: Optional[SampleLibrary],
+        label_schema: Optional[Sequence[str]],
+    ) -> Iterator[tuple[LabelRecord, Optional[str]]]:
+        # 대화별로 retrieve를 반복하면 매번 벡터라이저를 다시 적합하므로 한 번에 조회한다.
+        if library:
+            all_matches = self.retriever.retrieve_batch(conversations, library)
+        else:
+            all_matches = [[] for _ in conversations]
+
+        if self.llm_service is None:
+            for convo, matches in zip(conversations, all_matches):
+                yield self._make_record(convo, self._fallback_label(matches)), None
+            return
+
+        # 대화 여러 건을 프롬프트 하나로 묶어 호출 수를 줄이고,
+        # 묶음들은 네트워크 대기가 대부분이므로 병렬로 보낸다.
+        # map은 입력 순서를 보존하므로 인덱스 추적 없이 결과를 그대로 쓴다.
+        batch_size = max(1, getattr(self.llm_service, "batch_size", 1))
+        convo_chunks = [
+            conversations[start : start + batch_size]
+            for start in range(0, len(conversations), batch_size)
+        ]
+        match_chunks = [
+            all_matches[start : start + batch_size]
+            for start in range(0, len(all_matches), batch_size)
+        ]
+        workers = min(self.max_workers, max(1, len(convo_chunks)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            chunk_results = executor.map(
+                self._label_chunk,
+                convo_chunks,
+                match_chunks,
+                repeat(label_schema),
+            )
+            for convos, chunk_result in zip(convo_chunks, chunk_results):
+                for convo, (result, error) in zip(convos, chunk_result):
+                    yield self._make_record(convo, result), error
+
+    @staticmethod
+    def _make_record(convo: Conversation, result: LabelResult) -> LabelRecord:
+        return LabelRecord(
+            conversation_id=convo.id,
+            conversation_version=None,
+            result=result,
+            created_at=datetime.utcnow(),
+        )
+
+    def _label_chunk(
+        self,
+        convos: Sequence[Conversation],
+        match_lists: Sequence[Sequence[SampleMatch]],
+        label_schema: Optional[Sequence[str]],
+    ) -> List[tuple[LabelResult, Optional[str]]]:
+        try:
+            results = self.llm_service.label_batch(convos, match_lists, label_schema)
+            return [(result, None) for result in results]
+        except Exception as exc:  # pragma: no cover - fallback path
+            logger.exception(
+                "Labeling failed for %s", ", ".join(convo.id for convo in convos)
+            )
+            return [(self._fallback_label(matches), str(exc)) for matches in match_lists]
+
     def _fallback_label(self, matches: Sequence[SampleMatch]) -> LabelResult:
         if matches:
             primary = matches[0].label_primary
@@ -133,10 +206,13 @@ class LLMService:
         backend: Optional[LLMBackend] = None,
         model: str = "gpt-4o-mini",
         temperature: float = 0.1,
+        batch_size: int = 4,
     ) -> None:
         self.backend = backend or OpenAIBackend()
         self.model = model
         self.temperature = temperature
+        # 한 프롬프트에 묶어 보낼 대화 수 (1이면 기존처럼 개별 호출)
+        self.batch_size = batch_size
 
     def label(
         self,
@@ -159,8 +235,41 @@ class LLMService:
 
         text = self.backend.complete(messages, model=self.model, temperature=self.temperature)
 
-        payload = json.loads(text)
+        return self._result_from_payload(_json_loads(text))
+
+    def label_batch(
+        self,
+        conversations: Sequence[Conversation],
+        match_lists: Sequence[Sequence[SampleMatch]],
+        label_schema: Optional[Sequence[str]] = None,
+    ) -> List[LabelResult]:
+        """여러 대화를 한 번의 LLM 호출로 분류한다."""
+        if len(conversations) == 1:
+            return [self.label(conversations[0], match_lists[0], label_schema)]
 
+        prompt = self._build_batch_prompt(conversations, match_lists, label_schema)
+        messages: List[Dict[str, Any]] = [
+            {
+                "role": "system",
+                "content": "You classify customer service conversations. Always respond with JSON.",
+            },
+            {
+                "role": "user",
+                "content": prompt,
+            },
+        ]
+
+        text = self.backend.complete(messages, model=self.model, temperature=self.temperature)
+
+        payload = _json_loads(text)
+        if not isinstance(payload, list) or len(payload) != len(conversations):
+            raise ValueError(
+                f"배치 응답이 길이 {len(conversations)}의 JSON 배열이 아닙니다."
+            )
+        return [self._result_from_payload(item) for item in payload]
+
+    @staticmethod
+    def _result_from_payload(payload: Dict[str, Any]) -> LabelResult:
         references = [
             SampleReference(
                 sample_id=ref.get("sample_id"),
@@ -187,23 +296,66 @@ class LLMService:
         label_schema: Optional[Sequence[str]],
     ) -> str:
         schema_text = ", ".join(label_schema) if label_schema else "unknown"
-        conversation_text = "\n".join(
-            f"[{msg.created_at.isoformat()}] {msg.sender_type}: {msg.text}" for msg in conversation.messages
-        )
-        sample_lines = []
-        for idx, match in enumerate(matches):
-            summary = match.summary or ""
-            sample_lines.append(
-                f"Sample {idx+1}: label={match.label_primary}, score={match.score:.3f}, summary={summary}"
-            )
-        sample_text = "\n".join(sample_lines) if sample_lines else "(no reference samples)"
 
         return (
             "You will classify a conversation.\n"
             f"Possible labels: {schema_text}\n"
             "Reference samples:\n"
-            f"{sample_text}\n"
+            f"{self._sample_text(matches)}\n"
             "Conversation transcript:\n"
-            f"{conversation_text}\n"
-            "Respond with JSON: {\"label_primary\": str, \"label_secondary\": list[str], \"confidence\": number, \"summary\": str, \"reasoning\": str, \"references\": [{\"sample_id\": str, \"label\": str, \"score\": number}]}"
+            f"{self._transcript(conversation)}\n"
+            f"Respond with JSON: {self.RESULT_JSON_SCHEMA}"
         )
+
+    def _build_batch_prompt(
+        self,
+        conversations: Sequence[Conversation],
+        match_lists: Sequence[Sequence[SampleMatch]],
+        label_schema: Optional[Sequence[str]],
+    ) -> str:
+        schema_text = ", ".join(label_schema) if label_schema else "unknown"
+
+        sections = []
+        for idx, (conversation, matches) in enumerate(zip(conversations, match_lists)):
+            sections.append(
+                f"## Conversation {idx + 1}\n"
+                "Reference samples:\n"
+                f"{self._sample_text(matches)}\n"
+                "Transcript:\n"
+                f"{self._transcript(conversation)}"
+            )
+
+        return (
+            f"You will classify {len(conversations)} conversations.\n"
+            f"Possible labels: {schema_text}\n"
+            + "\n".join(sections)
+            + "\n"
+            f"Respond with a JSON array of length {len(conversations)} where element i "
+            "corresponds to conversation i+1. Each element is "
+            f"{self.RESULT_JSON_SCHEMA}"
+        )
+
+    RESULT_JSON_SCHEMA = (
+        "{\"label_primary\": str, \"label_secondary\": list[str], \"confidence\": number, "
+        "\"summary\": str, \"reasoning\": str, "
+        "\"references\": [{\"sample_id\": str, \"label\": str, \"score\": number}]}"
+    )
+
+    @staticmethod
+    def _transcript(conversation: Conversation) -> str:
+        # 빈 메시지는 토큰만 소모하므로 프롬프트에서 제외한다.
+        return "\n".join(
+            f"[{msg.created_at.isoformat()}] {msg.sender_type}: {msg.text}"
+            for msg in conversation.messages
+            if msg.text
+        )
+
+    @staticmethod
+    def _sample_text(matches: Sequence[SampleMatch]) -> str:
+        sample_lines = []
+        for idx, match in enumerate(matches):
+            line = f"Sample {idx+1}: label={match.label_primary}, score={match.score:.3f}"
+            if match.summary:
+                line += f", summary={match.summary}"
+            sample_lines.append(line)
+        return "\n".join(sample_lines) if sample_lines else "(no reference samples)"
@@ -1,5 +1,6 @@
 """Retrieval utilities for finding similar samples."""
 
+from .query_cache import QueryCache
 from .similarity import SimilarityRetriever
 
-__all__ = ["SimilarityRetriever"]
+__all__ = ["QueryCache", "SimilarityRetriever"]
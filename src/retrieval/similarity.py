@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable, List
+import hashlib
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Sequence
 
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
 from src.models.conversation import Conversation
-from src.models.sample import SampleLibrary, SampleMatch
+from src.models.sample import SampleLibrary, SampleMatch, SampleRecord
+from src.retrieval.query_cache import QueryCache
 
 
 @dataclass
@@ -21,27 +23,68 @@ class SimilarityRetriever:
     min_similarity: float = 0.0
     max_features: int = 1024
     ngram_range: tuple[int, int] = (1, 2)
+    _corpus_cache: Optional[tuple] = field(default=None, init=False, repr=False)
+    _query_cache: QueryCache = field(default_factory=QueryCache, init=False, repr=False)
 
     def retrieve(self, conversation: Conversation, library: SampleLibrary) -> List[SampleMatch]:
+        return self.retrieve_batch([conversation], library)[0]
+
+    def retrieve_batch(
+        self, conversations: Sequence[Conversation], library: SampleLibrary
+    ) -> List[List[SampleMatch]]:
+        """여러 대화의 유사도 점수를 한 번의 벡터화/행렬곱으로 계산한다."""
+        results: List[List[SampleMatch]] = [[] for _ in conversations]
         if library is None or len(library) == 0:
-            return []
+            return results
 
-        records_list = list(library)
-        texts = [record.summary_for_embedding for record in records_list]
-        if not conversation.messages:
-            return []
+        records_list, texts = self._library_corpus(library)
+        library_key = (library.origin, library.created_at, len(library))
 
-        convo_text = self._conversation_text(conversation)
-        corpus = texts + [convo_text]
+        # 반복 입력(양식 답변 등)은 캐시에서 바로 꺼내고 새 질의만 벡터화한다.
+        active: List[tuple[int, str, tuple]] = []
+        for position, conversation in enumerate(conversations):
+            if not conversation.messages:
+                continue
+            convo_text = self._conversation_text(conversation)
+            digest = hashlib.sha256(convo_text.encode("utf-8")).hexdigest()
+            cache_key = (library_key, digest)
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                results[position] = cached
+                continue
+            active.append((position, convo_text, cache_key))
+        if not active:
+            return results
+
+        corpus = texts + [convo_text for _, convo_text, _ in active]
 
         vectorizer = TfidfVectorizer(max_features=self.max_features, ngram_range=self.ngram_range)
         matrix = vectorizer.fit_transform(corpus)
 
-        sample_matrix = matrix[:-1]
-        convo_vector = matrix[-1]
+        sample_matrix = matrix[: len(texts)]
+        convo_matrix = matrix[len(texts) :]
+
+        score_matrix = cosine_similarity(convo_matrix, sample_matrix)
+
+        for (position, _, cache_key), scores in zip(active, score_matrix):
+            matches = self._matches_from_scores(scores, records_list)
+            results[position] = matches
+            self._query_cache.put(cache_key, matches)
+        return results
 
-        scores = cosine_similarity(convo_vector, sample_matrix)[0]
+    def _library_corpus(self, library: SampleLibrary) -> tuple[List[SampleRecord], List[str]]:
+        """같은 라이브러리로 반복 조회할 때 레코드/텍스트 목록을 다시 만들지 않는다."""
+        if self._corpus_cache is not None and self._corpus_cache[0] is library:
+            return self._corpus_cache[1], self._corpus_cache[2]
+
+        records_list = list(library)
+        texts = [record.summary_for_embedding for record in records_list]
+        self._corpus_cache = (library, records_list, texts)
+        return records_list, texts
 
+    def _matches_from_scores(
+        self, scores: np.ndarray, records_list: List[SampleRecord]
+    ) -> List[SampleMatch]:
         if np.isnan(scores).all():
             return []
 
@@ -43,6 +43,17 @@ class SampleManager:
     """Handles ingestion and optional embedding of labeled sample data."""
 
     REQUIRED_COLUMNS = {"label_primary", "summary"}
+    RESERVED_COLUMNS = frozenset(
+        {
+            "sample_id",
+            "label_primary",
+            "label_secondary",
+            "summary",
+            "raw_text",
+            "source_conversation_id",
+            "created_at",
+        }
+    )
     SECONDARY_SEPARATOR = ","
 
     def __init__(
@@ -66,9 +77,17 @@ class SampleManager:
         records: List[SampleRecord] = []
         skipped = 0
 
+        # created_at은 행마다 to_datetime을 부르는 대신 컬럼 전체를 한 번에 파싱한다.
+        created_series = (
+            pd.to_datetime(df["created_at"], errors="coerce", utc=False)
+            if "created_at" in df.columns
+            else None
+        )
+
         for idx, row in enumerate(df.to_dict(orient="records"), start=1):
             try:
-                record = self._row_to_record(row, origin=origin)
+                created_at = self._created_at_for_row(row, created_series, idx - 1)
+                record = self._row_to_record(row, origin=origin, created_at=created_at)
             except ValueError as exc:
                 errors.append(f"row {idx}: {exc}")
                 skipped += 1
@@ -96,7 +115,9 @@ class SampleManager:
             raise ValueError(f"필수 컬럼이 없습니다: {', '.join(sorted(missing))}")
         return df
 
-    def _row_to_record(self, row: dict, origin: str) -> SampleRecord:
+    def _row_to_record(
+        self, row: dict, origin: str, created_at: Optional[datetime] = None
+    ) -> SampleRecord:
         label_primary = self._require_str(row.get("label_primary"), "label_primary")
         summary = self._require_str(row.get("summary"), "summary")
 
@@ -104,22 +125,11 @@ class SampleManager:
         label_secondary = self._parse_secondary(row.get("label_secondary"))
         raw_text = self._get_optional_str(row.get("raw_text"))
         source_conversation_id = self._get_optional_str(row.get("source_conversation_id"))
-        created_at = self._parse_datetime(row.get("created_at"))
 
         meta = {
             key: value
             for key, value in row.items()
-            if key
-            not in {
-                "sample_id",
-                "label_primary",
-                "label_secondary",
-                "summary",
-                "raw_text",
-                "source_conversation_id",
-                "created_at",
-            }
-            and not self._is_missing(value)
+            if key not in self.RESERVED_COLUMNS and not self._is_missing(value)
         }
 
         return SampleRecord(
@@ -141,12 +151,13 @@ class SampleManager:
         if not library:
             return 0
 
-        texts = [record.summary_for_embedding for record in library]
+        records = list(library)
+        texts = [record.summary_for_embedding for record in records]
         embeddings = self._embedder.embed(texts)
         if len(embeddings) != len(texts):
             raise ValueError("임베딩 결과 수가 샘플 수와 일치하지 않습니다.")
 
-        self._vector_store.upsert_samples(list(library), embeddings)
+        self._vector_store.upsert_samples(records, embeddings)
         return len(texts)
 
     def _parse_secondary(self, value: Optional[object]) -> List[str]:
@@ -159,24 +170,21 @@ class SampleManager:
         items = [item.strip() for item in value.split(self.SECONDARY_SEPARATOR)]
         return [item for item in items if item]
 
-    def _parse_datetime(self, value: Optional[object]) -> Optional[datetime]:
-        if value is None or self._is_missing(value):
+    def _created_at_for_row(
+        self,
+        row: dict,
+        created_series: Optional[pd.Series],
+        position: int,
+    ) -> Optional[datetime]:
+        if created_series is None:
             return None
-        try:
-            parsed = pd.to_datetime(value, errors="raise", utc=False)
-        except (ValueError, TypeError) as exc:
-            raise ValueError(f"created_at 값을 datetime으로 변환할 수 없습니다: {value}") from exc
-        if isinstance(parsed, pd.Series):
-            parsed = parsed.iloc[0]
-        if hasattr(parsed, "to_pydatetime"):
-            converted = parsed.to_pydatetime()
-            if isinstance(converted, datetime):
-                return converted
-            if isinstance(converted, (list, tuple)) and converted:
-                return converted[0]
-        if isinstance(parsed, datetime):
-            return parsed
-        raise ValueError(f"created_at 값을 datetime으로 변환할 수 없습니다: {value}")
+        parsed = created_series.iat[position]
+        if pd.isna(parsed):
+            raw = row.get("created_at")
+            if self._is_missing(raw):
+                return None
+            raise ValueError(f"created_at 값을 datetime으로 변환할 수 없습니다: {raw}")
+        return parsed.to_pydatetime()
 
     @staticmethod
     def _require_str(value: Optional[object], field: str) -> str:
@@ -6,10 +6,12 @@ from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional, Sequence
 from uuid import uuid4
 
+import numpy as np
+
 from src.models.sample import SampleRecord
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SampleVectorEntry:
     sample_id: str
     embedding: List[float]
@@ -24,20 +26,22 @@ class VectorStore:
         self._sample_vectors: Dict[str, SampleVectorEntry] = {}
 
     def upsert_samples(
-        self, records: Sequence[SampleRecord], embeddings: Sequence[Sequence[float]]
+        self, records: Iterable[SampleRecord], embeddings: Iterable[Sequence[float]]
     ) -> None:
-        if len(records) != len(embeddings):
-            raise ValueError("records와 embeddings 수가 일치해야 합니다.")
-
-        for record, embedding in zip(records, embeddings):
-            vector_id = record.vector_id or record.sample_id or str(uuid4())
-            entry = SampleVectorEntry(
-                sample_id=record.sample_id,
-                vector_id=vector_id,
-                record=record,
-                embedding=[float(x) for x in embedding],
-            )
-            self._sample_vectors[vector_id] = entry
+        # strict zip으로 개수 불일치를 잡으면서, 전체를 리스트로 모으지 않은
+        # 제너레이터/청크 단위 입력도 그대로 흘려보낼 수 있다.
+        try:
+            for record, embedding in zip(records, embeddings, strict=True):
+                vector_id = record.vector_id or record.sample_id or str(uuid4())
+                entry = SampleVectorEntry(
+                    sample_id=record.sample_id,
+                    vector_id=vector_id,
+                    record=record,
+                    embedding=np.asarray(embedding, dtype=float).tolist(),
+                )
+                self._sample_vectors[vector_id] = entry
+        except ValueError as exc:
+            raise ValueError("records와 embeddings 수가 일치해야 합니다.") from exc
 
     def get_sample_vector(self, vector_id: str) -> Optional[SampleVectorEntry]:
         return self._sample_vectors.get(vector_id)
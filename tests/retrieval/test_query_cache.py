@@ -0,0 +1,32 @@
+from src.retrieval import QueryCache
+
+
+def test_query_cache_hit_and_miss() -> None:
+    cache = QueryCache(max_size=2, ttl_seconds=600)
+
+    assert cache.get("a") is None
+    cache.put("a", [1, 2])
+
+    assert cache.get("a") == [1, 2]
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_query_cache_evicts_least_recently_used() -> None:
+    cache = QueryCache(max_size=2, ttl_seconds=600)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_query_cache_expires_entries() -> None:
+    cache = QueryCache(max_size=2, ttl_seconds=0)
+    cache.put("a", 1)
+
+    assert cache.get("a") is None
@@ -4,7 +4,6 @@ import io
 import json
 import os
 import sys
-from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -43,6 +42,9 @@ MOCK_BATCH_DIR = DATA_DIR / "mock_batches"
 
 RAW_ALLOWED_EXTENSIONS = {".xlsx", ".xls", ".csv"}
 
+# ChannelTalkCSVAdapter가 실제로 사용하는 시트 계열 (예: "UserChat data")
+RAW_SHEET_PREFIXES = ("userchat", "message", "user", "manager", "bot", "workflow")
+
 
 def main() -> None:
     st.set_page_config(page_title="Review Labeling MVP", layout="wide")
@@ -68,24 +70,36 @@ def main() -> None:
         render_insight_tab()
 
 
+# session_state에 없는 키를 None 값과 구분하기 위한 센티널
+_UNSET = object()
+
+
 def init_state() -> None:
-    if "vector_store" not in st.session_state:
-        st.session_state["vector_store"] = VectorStore()
-    st.session_state.setdefault("vector_store_rehydrated", False)
+    # 매 rerun마다 십여 번 접근하므로 프록시 속성 조회를 한 번으로 줄인다
+    ss = st.session_state
 
-    if "sample_library" not in st.session_state:
+    if "vector_store" not in ss:
+        ss["vector_store"] = VectorStore()
+    ss.setdefault("vector_store_rehydrated", False)
+
+    # 멤버십 검사 후 다시 읽는 대신 한 번의 get으로 조회한다
+    library = ss.get("sample_library", _UNSET)
+    if library is _UNSET:
         library = load_library_from_disk()
-        st.session_state["sample_library"] = library
+        ss["sample_library"] = library
+        rebuild_vector_store(library)
+    elif not ss["vector_store_rehydrated"]:
         rebuild_vector_store(library)
-    elif not st.session_state["vector_store_rehydrated"]:
-        rebuild_vector_store(st.session_state.get("sample_library"))
 
-    st.session_state.setdefault("sample_ingestion_result", None)
-    st.session_state.setdefault("raw_data_info", None)
-    st.session_state.setdefault("labeling_result", None)
-    st.session_state.setdefault("mock_batch_info", None)
-    st.session_state.setdefault("mock_batch_df", None)
-    st.session_state.setdefault("mock_batch_conversations", None)
+    for key in (
+        "sample_ingestion_result",
+        "raw_data_info",
+        "labeling_result",
+        "mock_batch_info",
+        "mock_batch_df",
+        "mock_batch_conversations",
+    ):
+        ss.setdefault(key, None)
 
 
 def render_sample_intro() -> None:
@@ -122,9 +136,11 @@ def render_sample_section() -> None:
         path = save_uploaded_file(uploaded_file) if save_to_disk else write_temp_file(uploaded_file)
         try:
             embedder = TfidfEmbedder() if auto_embed else None
+            # 공유 스토어를 건드리지 않도록 임시 스토어에 임베딩한다.
+            # 업로드 후 rebuild_vector_store가 병합 라이브러리로 새 스토어를 만든다.
             manager = SampleManager(
                 embedder=embedder,
-                vector_store=st.session_state["vector_store"],
+                vector_store=VectorStore(),
             )
             result = manager.ingest_from_csv(path, origin=origin_label, auto_embed=auto_embed)
         except Exception as exc:  # broad to show error in UI
@@ -211,7 +227,7 @@ def render_labeling_section(info: Dict[str, Any]) -> None:
         llm_service = None
         if use_llm:
             try:
-                llm_service = LLMService(model=settings.llm.model_name, temperature=settings.llm.temperature)
+                llm_service = get_llm_service(settings.llm.model_name, settings.llm.temperature)
             except Exception as exc:
                 st.error(f"LLM 서비스를 초기화할 수 없습니다: {exc}")
                 return
@@ -241,7 +257,7 @@ def render_labeling_overview() -> None:
     st.subheader("라벨링 결과")
     st.dataframe(df, use_container_width=True, hide_index=True)
 
-    csv_bytes = df.to_csv(index=False).encode("utf-8")
+    csv_bytes = dataframe_to_csv_bytes(df)
     st.download_button(
         "라벨 결과 CSV 다운로드",
         data=csv_bytes,
@@ -294,25 +310,18 @@ def render_insight_tab() -> None:
         st.info("Mock 배치를 실행하면 라벨 기반 인사이트를 확인할 수 있습니다.")
         return
 
-    df = export_df.copy()
-    if "started_at" not in df or df["started_at"].isna().all():
+    if "started_at" not in export_df or export_df["started_at"].isna().all():
         st.warning("started_at 정보가 없어 인사이트를 계산할 수 없습니다.")
         return
 
-    df["started_at"] = pd.to_datetime(df["started_at"], errors="coerce")
-    df.dropna(subset=["started_at"], inplace=True)
+    df, weekly, pivot = _weekly_label_insight(export_df)
     if df.empty:
         st.warning("유효한 started_at 값이 없습니다.")
         return
-
-    df["week"] = df["started_at"].dt.strftime("%Y-%W")
-
-    weekly = df.groupby(["week", "label_primary"]).size().reset_index(name="count")
     if weekly.empty:
         st.info("라벨 데이터가 없어 인사이트를 생성할 수 없습니다.")
         return
 
-    pivot = weekly.pivot(index="week", columns="label_primary", values="count").fillna(0)
     st.subheader("주간 라벨 비중")
     st.dataframe(pivot, use_container_width=True)
     st.bar_chart(pivot)
@@ -337,6 +346,40 @@ def render_insight_tab() -> None:
         for summary in top_samples:
             st.write(f"- {summary}")
 
+
+@st.cache_data(show_spinner=False)
+def _weekly_label_insight(
+    export_df: pd.DataFrame,
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """인사이트 탭의 주간 집계. 같은 배치 결과면 rerun마다 groupby를 반복하지 않는다."""
+    df = export_df.copy()
+    df["started_at"] = pd.to_datetime(df["started_at"], errors="coerce")
+    df.dropna(subset=["started_at"], inplace=True)
+    if df.empty:
+        empty = pd.DataFrame()
+        return df, empty, empty
+
+    df["week"] = df["started_at"].dt.strftime("%Y-%W")
+    weekly = df.groupby(["week", "label_primary"], observed=True).size().reset_index(name="count")
+    if weekly.empty:
+        return df, weekly, pd.DataFrame()
+
+    pivot = weekly.pivot(index="week", columns="label_primary", values="count").fillna(0)
+    return df, weekly, pivot
+
+
+@st.cache_data(show_spinner=False)
+def _read_file_bytes(path: str, mtime: float) -> bytes:
+    """(경로, 수정시각) 키로 캐시되는 파일 읽기. rerun마다 디스크를 다시 읽지 않는다."""
+    return Path(path).read_bytes()
+
+
+@st.cache_data(show_spinner=False)
+def _read_json_file(path: str, mtime: float) -> Any:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
 def render_mock_batch_overview() -> None:
     info = st.session_state.get("mock_batch_info") or {}
     df: Optional[pd.DataFrame] = st.session_state.get("mock_batch_df")
@@ -360,7 +403,7 @@ def render_mock_batch_overview() -> None:
     if labels_path.exists():
         st.download_button(
             "라벨 JSON 다운로드",
-            data=labels_path.read_bytes(),
+            data=_read_file_bytes(str(labels_path), labels_path.stat().st_mtime),
             file_name=labels_path.name,
             mime="application/json",
             key=f"download_mock_labels_{info.get('timestamp','')}",
@@ -368,12 +411,12 @@ def render_mock_batch_overview() -> None:
 
     raw_userchats = Path(info["raw_dir"]) / "user_chats.json"
     if raw_userchats.exists():
-        raw_payload = json.loads(raw_userchats.read_text(encoding="utf-8"))
+        raw_mtime = raw_userchats.stat().st_mtime
         with st.expander("Raw userChats 미리보기"):
-            st.json(raw_payload)
+            st.json(_read_json_file(str(raw_userchats), raw_mtime))
         st.download_button(
             "Raw userChats JSON 다운로드",
-            data=raw_userchats.read_bytes(),
+            data=_read_file_bytes(str(raw_userchats), raw_mtime),
             file_name=raw_userchats.name,
             mime="application/json",
             key=f"download_mock_raw_{info.get('timestamp','')}",
@@ -381,12 +424,12 @@ def render_mock_batch_overview() -> None:
 
     ids_path = info.get("ids_path")
     if ids_path and Path(ids_path).exists():
-        ids_data = Path(ids_path).read_text(encoding="utf-8")
+        ids_mtime = Path(ids_path).stat().st_mtime
         with st.expander("신규 inquiry_ids"):
-            st.write(json.loads(ids_data))
+            st.write(_read_json_file(ids_path, ids_mtime))
         st.download_button(
             "new_inquiry_ids.json 다운로드",
-            data=ids_data.encode("utf-8"),
+            data=_read_file_bytes(ids_path, ids_mtime),
             file_name=Path(ids_path).name,
             mime="application/json",
             key=f"download_mock_ids_{info.get('timestamp','')}",
@@ -394,14 +437,13 @@ def render_mock_batch_overview() -> None:
 
     domain_path = Path(info["domain_path"])
     if domain_path.exists():
-        domain_payload = json.loads(domain_path.read_text(encoding="utf-8"))
         with st.expander("도메인 스냅샷 미리보기"):
-            st.json(domain_payload)
+            st.json(_read_json_file(str(domain_path), domain_path.stat().st_mtime))
 
     if export_df is not None and not export_df.empty:
         st.subheader("라벨링 Export (대화별)")
         st.dataframe(export_df, use_container_width=True, hide_index=True)
-        csv_bytes = export_df.to_csv(index=False).encode("utf-8")
+        csv_bytes = dataframe_to_csv_bytes(export_df)
         st.download_button(
             "Mock 배치 Export CSV 다운로드",
             data=csv_bytes,
@@ -411,7 +453,7 @@ def render_mock_batch_overview() -> None:
         )
     elif df is not None and not df.empty:
         st.dataframe(df, use_container_width=True, hide_index=True)
-        csv_bytes = df.to_csv(index=False).encode("utf-8")
+        csv_bytes = dataframe_to_csv_bytes(df)
         st.download_button(
             "Mock 배치 라벨 CSV 다운로드",
             data=csv_bytes,
@@ -527,6 +569,30 @@ def render_raw_data_overview() -> None:
     render_labeling_section(info)
 
 
+@st.cache_data(show_spinner=False)
+def dataframe_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """다운로드 버튼용 CSV 바이트. 가능하면 Arrow의 멀티스레드 writer로 직렬화한다.
+
+    매 rerun마다 같은 결과를 다시 직렬화하지 않도록 캐시한다
+    (st.cache_data가 DataFrame 내용을 해시해 키로 사용).
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        sink = io.BytesIO()
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), sink)
+        return sink.getvalue()
+    except Exception:  # pyarrow 미설치 또는 변환 불가 타입
+        return df.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_resource(show_spinner=False)
+def get_llm_service(model: str, temperature: float) -> LLMService:
+    """재실행마다 OpenAI 클라이언트(커넥션 풀)를 새로 만들지 않도록 공유한다."""
+    return LLMService(model=model, temperature=temperature)
+
+
 def save_uploaded_file(uploaded_file: UploadedFile) -> Path:
     SAMPLE_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
@@ -561,32 +627,46 @@ def persist_library(library: SampleLibrary) -> None:
 
 
 def rebuild_vector_store(library: Optional[SampleLibrary]) -> None:
-    store = VectorStore()
     if library and len(library):
-        embedder = TfidfEmbedder()
-        records = list(library)
-        embeddings = embedder.embed([record.summary_for_embedding for record in records])
-        store.upsert_samples(records, embeddings)
+        store = _embedded_vector_store(
+            (library.origin, library.created_at, len(library)), library
+        )
+    else:
+        store = VectorStore()
     st.session_state["vector_store"] = store
     st.session_state["vector_store_rehydrated"] = True
 
 
+@st.cache_resource(show_spinner=False)
+def _embedded_vector_store(library_key: tuple, _library: SampleLibrary) -> VectorStore:
+    """라이브러리 식별자별로 임베딩된 스토어를 프로세스 전역에 공유한다.
+
+    세션이 새로 열리거나 rerun에서 재수화될 때마다 전체 샘플을 다시
+    임베딩하지 않기 위함이다. 라이브러리가 바뀌면 키가 바뀌어 새로 만든다.
+    """
+    store = VectorStore()
+    embedder = TfidfEmbedder()
+    records = list(_library)
+    embeddings = embedder.embed([record.summary_for_embedding for record in records])
+    store.upsert_samples(records, embeddings)
+    return store
+
+
 def process_raw_upload(uploaded_file: UploadedFile, save_to_disk: bool) -> Dict[str, Any]:
-    print(f"[process_raw_upload] 시작 - 파일명: {uploaded_file.name}, 크기: {len(uploaded_file.getvalue())} bytes")
+    print(f"[process_raw_upload] 시작 - 파일명: {uploaded_file.name}, 크기: {uploaded_file.size} bytes")
     extension = Path(uploaded_file.name).suffix.lower()
     if extension not in RAW_ALLOWED_EXTENSIONS:
         raise ValueError(f"지원하지 않는 파일 확장자입니다: {extension}")
 
-    file_bytes = uploaded_file.getvalue()
     saved_path: Optional[Path] = None
     if save_to_disk:
         RAW_DIR.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         saved_path = RAW_DIR / f"raw_{timestamp}{extension}"
-        saved_path.write_bytes(file_bytes)
+        saved_path.write_bytes(uploaded_file.getbuffer())
         print(f"[process_raw_upload] 파일 저장 완료: {saved_path}")
 
-    dataframes = read_raw_file(file_bytes, extension)
+    dataframes = read_raw_file(uploaded_file, extension)
     print(f"[process_raw_upload] 시트 로드 완료: {list(dataframes.keys())}")
 
     sheet_summaries = []
@@ -616,24 +696,49 @@ def process_raw_upload(uploaded_file: UploadedFile, save_to_disk: bool) -> Dict[
         "uploaded_at": datetime.utcnow(),
         "saved_path": str(saved_path) if saved_path else None,
         "sheet_summaries": sheet_summaries,
-        "dataframes": dataframes,
         "conversations": conversations,
         "normalized_records": normalized_records,
         "normalized_path": normalized_path,
     }
 
 
-def read_raw_file(file_bytes: bytes, extension: str) -> Dict[str, pd.DataFrame]:
-    buffer = io.BytesIO(file_bytes)
+def read_raw_file(uploaded_file: UploadedFile, extension: str) -> Dict[str, pd.DataFrame]:
     if extension in {".xlsx", ".xls"}:
-        return pd.read_excel(buffer, sheet_name=None)
-    buffer.seek(0)
-    return {"csv": pd.read_csv(buffer)}
+        # Excel 리더는 seekable 바이너리 버퍼가 필요하므로 xlsx 경로에서만 감싼다.
+        buffer = io.BytesIO(uploaded_file.getbuffer())
+        try:
+            # calamine(러스트 기반)이 설치돼 있으면 openpyxl보다 훨씬 빠르게 파싱한다.
+            excel = pd.ExcelFile(buffer, engine="calamine")
+        except (ImportError, ValueError):
+            buffer.seek(0)
+            excel = pd.ExcelFile(buffer)
+        return pd.read_excel(excel, sheet_name=_select_raw_sheets(excel.sheet_names))
+    uploaded_file.seek(0)
+    # 다운스트림 정규화는 모든 값을 텍스트로 다루므로 타입 추론/NaN 스캔을 생략한다.
+    return {
+        "csv": pd.read_csv(
+            uploaded_file,
+            dtype=str,
+            keep_default_na=False,
+            na_filter=False,
+            engine="c",
+            low_memory=False,
+        )
+    }
+
+
+def _select_raw_sheets(sheet_names: List[str]) -> List[str]:
+    """정규화에 쓰이는 시트만 고른다. 아는 시트가 없으면 전체를 유지한다."""
+    wanted = [
+        name
+        for name in sheet_names
+        if "".join(ch for ch in name.lower() if ch.isalnum()).startswith(RAW_SHEET_PREFIXES)
+    ]
+    return wanted or list(sheet_names)
 
 
 def clear_library() -> None:
-    if SAMPLE_LIBRARY_PATH.exists():
-        SAMPLE_LIBRARY_PATH.unlink()
+    SAMPLE_LIBRARY_PATH.unlink(missing_ok=True)
     st.session_state["sample_library"] = None
     st.session_state["sample_ingestion_result"] = None
     st.session_state["vector_store"] = VectorStore()
@@ -647,8 +752,8 @@ def clear_raw_data() -> None:
         if saved_path:
             path = Path(saved_path)
             try:
-                if path.exists() and RAW_DIR.resolve() in path.resolve().parents:
-                    path.unlink()
+                if RAW_DIR.resolve() in path.resolve().parents:
+                    path.unlink(missing_ok=True)
             except OSError:
                 pass
     st.session_state["raw_data_info"] = None
@@ -715,7 +820,7 @@ def run_mock_batch_pipeline(library: SampleLibrary, count: int, use_llm: bool) -
             f"OPENAI_API_KEY={'set' if os.getenv('OPENAI_API_KEY') else 'missing'}"
         )
         try:
-            llm_service = LLMService(model=settings.llm.model_name, temperature=settings.llm.temperature)
+            llm_service = get_llm_service(settings.llm.model_name, settings.llm.temperature)
         except Exception as exc:
             st.error(f"LLM 초기화 실패: {exc}")
             raise
@@ -760,41 +865,45 @@ def run_mock_batch_pipeline(library: SampleLibrary, count: int, use_llm: bool) -
 
 
 def library_to_dataframe(library: SampleLibrary) -> pd.DataFrame:
-    rows = []
-    for record in library:
-        rows.append(sample_record_to_row(record))
-    return pd.DataFrame(rows)
+    return pd.DataFrame([sample_record_to_row(record) for record in library])
 
 
 def sample_record_to_row(record: SampleRecord) -> dict:
-    data = asdict(record)
-    meta = data.pop("meta", {}) or {}
-    data["meta"] = json.dumps(meta, ensure_ascii=False) if meta else ""
-    data["created_at"] = record.created_at.strftime("%Y-%m-%d %H:%M:%S") if record.created_at else ""
-    data["label_secondary"] = ", ".join(record.label_secondary)
-    data["summary_for_embedding"] = record.summary_for_embedding[:120] + (
-        "..." if len(record.summary_for_embedding) > 120 else ""
-    )
-    return data
+    # asdict()는 중첩 구조까지 재귀 복사하므로 표시용 필드만 직접 꺼낸다
+    summary = record.summary_for_embedding
+    return {
+        "sample_id": record.sample_id,
+        "label_primary": record.label_primary,
+        "label_secondary": ", ".join(record.label_secondary),
+        # 짧은 요약은 자르기/이어붙이기 없이 원본 문자열을 그대로 쓴다
+        "summary_for_embedding": summary if len(summary) <= 120 else summary[:120] + "...",
+        "raw_text": record.raw_text,
+        "source_conversation_id": record.source_conversation_id,
+        "origin": record.origin,
+        "created_at": record.created_at.strftime("%Y-%m-%d %H:%M:%S") if record.created_at else "",
+        "vector_id": record.vector_id,
+        "meta": json.dumps(record.meta, ensure_ascii=False) if record.meta else "",
+    }
 
 
 def label_records_to_dataframe(records: List[LabelRecord]) -> pd.DataFrame:
-    rows = []
-    for record in records:
-        rows.append(
-            {
-                "conversation_id": record.conversation_id,
-                "label_primary": record.result.label_primary,
-                "label_secondary": ", ".join(record.result.label_secondary),
-                "confidence": record.result.confidence,
-                "references": ", ".join(
+    # 행 단위 dict 리스트 대신 컬럼 단위로 조립해 중간 dict 생성과 dtype 추론을 줄인다
+    return pd.DataFrame(
+        {
+            "conversation_id": [record.conversation_id for record in records],
+            "label_primary": [record.result.label_primary for record in records],
+            "label_secondary": [", ".join(record.result.label_secondary) for record in records],
+            "confidence": [record.result.confidence for record in records],
+            "references": [
+                ", ".join(
                     f"{ref.sample_id}:{ref.label}({ref.score:.2f})" if ref.score is not None else f"{ref.sample_id}:{ref.label}"
                     for ref in record.result.references
-                ),
-                "created_at": record.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-            }
-        )
-    return pd.DataFrame(rows)
+                )
+                for record in records
+            ],
+            "created_at": [record.created_at.strftime("%Y-%m-%d %H:%M:%S") for record in records],
+        }
+    )
 
 
 def serialize_label_record(record: LabelRecord) -> Dict[str, Any]:
@@ -853,14 +962,25 @@ def build_export_dataframe(conversations: List[Conversation], records: List[Labe
                 ),
             }
         )
-    return pd.DataFrame(rows)
+    export_df = pd.DataFrame(rows)
+    if not export_df.empty:
+        # 라벨/채널 값은 소수의 고유값이 반복되므로 categorical로 저장해
+        # 인사이트 탭의 groupby/필터가 정수 코드 위에서 동작하게 한다.
+        for column in ("channel_id", "label_primary", "label_secondary"):
+            export_df[column] = export_df[column].astype("category")
+    return export_df
 
 
 def sample_label_schema(library: SampleLibrary) -> List[str]:
     if not library:
         return []
-    labels = {record.label_primary for record in library}
-    return sorted(labels)
+    # 라이브러리 전수 순회를 rerun마다 반복하지 않도록 식별자 키로 캐시한다
+    return _cached_label_schema((library.origin, library.created_at, len(library)), library)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_label_schema(library_key: tuple, _library: SampleLibrary) -> List[str]:
+    return sorted({record.label_primary for record in _library})
 
 
 if __name__ == "__main__":